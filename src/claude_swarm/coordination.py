@@ -112,13 +112,16 @@ class CoordinationManager:
 
     def read_note(self, worker_id: str) -> SharedNote | None:
         """Read a single worker's note file. Returns None if missing or invalid."""
-        note_path = self.notes_dir / f"{worker_id}.json"
-        if not note_path.exists():
-            return None
+        return self._load_note(self.notes_dir / f"{worker_id}.json")
+
+    @staticmethod
+    def _load_note(note_path: Path) -> SharedNote | None:
+        # Parse and validate in one pass; invalid JSON surfaces as a ValidationError
         try:
-            raw = json.loads(note_path.read_text())
-            return SharedNote.model_validate(raw)
-        except (json.JSONDecodeError, ValueError):
+            return SharedNote.model_validate_json(note_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValueError:
             logger.warning("Invalid note file: %s", note_path)
             return None
 
@@ -128,8 +131,7 @@ class CoordinationManager:
             return []
         notes: list[SharedNote] = []
         for path in sorted(self.notes_dir.glob("*.json")):
-            worker_id = path.stem
-            note = self.read_note(worker_id)
+            note = self._load_note(path)
             if note is not None:
                 notes.append(note)
         return notes
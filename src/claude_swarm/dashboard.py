@@ -48,28 +48,42 @@ def _format_elapsed(started_at: str | None, completed_at: str | None = None) ->
         return "--"
 
 
-def _tail_events(path: Path | None, n: int = 3) -> list[dict]:
+def _tail_events(
+    path: Path | None, n: int = 3, block_size: int = 8192, max_bytes: int = 256 * 1024,
+) -> list[dict]:
     """Read the last N events from a JSONL file.
 
-    Seeks from end of file for efficiency. Returns [] if path is None
-    or file doesn't exist.
+    Seeks backwards from end of file in ``block_size`` steps until N complete
+    lines are buffered, so cost scales with the tail, not the file size.
+    Stops after ``max_bytes`` so one huge event line can't make every redraw
+    read megabytes; only the complete lines found so far are returned then.
+    Returns [] if path is None or file doesn't exist.
     """
     if path is None or not path.exists():
         return []
     try:
-        size = path.stat().st_size
-        if size == 0:
-            return []
         with open(path, "rb") as f:
-            # Read from end to find last N lines
-            chunk_size = min(size, 8192)
-            f.seek(-chunk_size, os.SEEK_END)
-            data = f.read().decode("utf-8", errors="replace")
+            pos = f.seek(0, os.SEEK_END)
+            if pos == 0:
+                return []
+            end = pos
+            blocks: list[bytes] = []
+            newlines = 0
+            # Need n+1 newlines so the oldest of the last n lines is complete
+            while pos > 0 and newlines <= n and end - pos < max_bytes:
+                step = min(block_size, pos, max_bytes - (end - pos))
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                blocks.append(block)
+                newlines += block.count(b"\n")
+        buf = b"".join(reversed(blocks))
         # Discard partial first line if we didn't read from start of file
-        if chunk_size < size:
-            first_nl = data.find("\n")
+        if pos > 0:
+            first_nl = buf.find(b"\n")
             if first_nl >= 0:
-                data = data[first_nl + 1:]
+                buf = buf[first_nl + 1:]
+        data = buf.decode("utf-8", errors="replace")
         lines = [line for line in data.strip().split("\n") if line.strip()]
         events = []
         for line in lines[-n:]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import Any
@@ -10,15 +11,23 @@ from claude_agent_sdk import PermissionResultAllow, PermissionResultDeny, ToolPe
 
 logger = logging.getLogger(__name__)
 
-_BASH_DENY_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+# Shared allow verdict; the SDK only reads it, so one instance serves every call
+_ALLOW = PermissionResultAllow()
+
+# Frozen: the combined scanner below is compiled from this table at import
+_BASH_DENY_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
     (re.compile(r"git\s+push\s+.*--force\b"), "Force push is blocked"),
     (re.compile(r"git\s+push\s+.*-[a-zA-Z]*f[a-zA-Z]*\b"), "Force push is blocked"),
-    (re.compile(r"git\s+checkout\s+(main|master)\b"), "Checking out protected branch is blocked"),
-    (re.compile(r"git\s+switch\s+(main|master)\b"), "Switching to protected branch is blocked"),
+    (re.compile(r"git\s+checkout\s+(?:main|master)\b"), "Checking out protected branch is blocked"),
+    (re.compile(r"git\s+switch\s+(?:main|master)\b"), "Switching to protected branch is blocked"),
     (re.compile(r"rm\s+-[a-zA-Z]*r[a-zA-Z]*f[a-zA-Z]*\s+/"), "Recursive delete on absolute path is blocked"),
     (re.compile(r"rm\s+-[a-zA-Z]*f[a-zA-Z]*r[a-zA-Z]*\s+/"), "Recursive delete on absolute path is blocked"),
-    (re.compile(r"rm\s+.*-r\b.*-f\b.*\s+/"), "Recursive delete on absolute path is blocked"),
-    (re.compile(r"rm\s+.*-f\b.*-r\b.*\s+/"), "Recursive delete on absolute path is blocked"),
+    # Split flags (rm -r -f /). Equivalent to r"rm\s+.*-r\b.*-f\b.*\s+/" but each
+    # span stops at the first flag, so a failing scan is linear, not cubic
+    (re.compile(r"rm\s+(?=\S)(?:[^\n-]|-(?!r\b))*-r\b(?:[^\n-]|-(?!f\b))*-f\b[^\n]*(?:\s|\n\s*)/"),
+     "Recursive delete on absolute path is blocked"),
+    (re.compile(r"rm\s+(?=\S)(?:[^\n-]|-(?!f\b))*-f\b(?:[^\n-]|-(?!r\b))*-r\b[^\n]*(?:\s|\n\s*)/"),
+     "Recursive delete on absolute path is blocked"),
     (re.compile(r"git\s+reset\s+--hard\b"), "Hard reset is blocked"),
     (re.compile(r"git\s+clean\s+-[a-zA-Z]*f"), "git clean -f is blocked"),
     (re.compile(r"DROP\s+TABLE", re.IGNORECASE), "DROP TABLE is blocked"),
@@ -39,8 +48,7 @@ _BASH_DENY_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     (re.compile(r"\|\s*netcat\b"), "Piping to netcat is blocked"),
     (re.compile(r"\|\s*ncat\b"), "Piping to ncat is blocked"),
     # 4. Reverse shells — /dev/tcp, /dev/udp, nc -e
-    (re.compile(r"/dev/tcp/"), "/dev/tcp access is blocked (reverse shell vector)"),
-    (re.compile(r"/dev/udp/"), "/dev/udp access is blocked (reverse shell vector)"),
+    # (/dev/tcp/ and /dev/udp/ are fixed strings — see _BASH_DENY_LITERALS)
     (re.compile(r"\bnc\b[^;&|\n]*-[a-zA-Z]*e\b"), "nc -e is blocked (reverse shell vector)"),
     (re.compile(r"\bncat\b[^;&|\n]*-[a-zA-Z]*e\b"), "ncat -e is blocked (reverse shell vector)"),
     # 5. System path overwrite — redirect/tee to /etc, /var, /usr, /sys, /proc
@@ -63,23 +71,92 @@ _BASH_DENY_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     (re.compile(r"\bfind\s+/\S*\s.*-exec\s+rm\b"), "find -exec rm on absolute path is blocked"),
     # 8. Dangerous chmod — 777 or system paths
     (re.compile(r"\bchmod\b.*\b777\b"), "chmod 777 is blocked"),
-    (re.compile(r"\bchmod\b.*\s+/etc/"), "chmod on /etc/ is blocked"),
-    (re.compile(r"\bchmod\b.*\s+/usr/"), "chmod on /usr/ is blocked"),
-    (re.compile(r"\bchmod\b.*\s+/sys/"), "chmod on /sys/ is blocked"),
+    # r".*\s+/etc/" spelled so the two spans can't trade whitespace (quadratic backtracking)
+    (re.compile(r"\bchmod\b[^\n]*(?:\s|\n\s*)/etc/"), "chmod on /etc/ is blocked"),
+    (re.compile(r"\bchmod\b[^\n]*(?:\s|\n\s*)/usr/"), "chmod on /usr/ is blocked"),
+    (re.compile(r"\bchmod\b[^\n]*(?:\s|\n\s*)/sys/"), "chmod on /sys/ is blocked"),
     # 9. Fork bombs
     (re.compile(r":\(\)\s*\{"), "Fork bomb pattern is blocked"),
     # 10. Git remote abuse
     (re.compile(r"git\s+remote\s+add\b"), "Adding git remotes is blocked"),
     (re.compile(r"git\s+remote\s+set-url\b"), "Changing git remote URLs is blocked"),
-]
+)
+
+# Fixed-substring rules, checked with str containment instead of regex. In
+# table order they sit just before the `nc -e` rule, at this index
+_BASH_DENY_LITERALS: tuple[tuple[str, str], ...] = (
+    ("/dev/tcp/", "/dev/tcp access is blocked (reverse shell vector)"),
+    ("/dev/udp/", "/dev/udp access is blocked (reverse shell vector)"),
+)
+_BASH_DENY_LITERALS_AT = next(
+    i for i, (pattern, _) in enumerate(_BASH_DENY_PATTERNS) if pattern.pattern.startswith(r"\bnc\b")
+)
+
+# Every deny rule needs at least one of these substrings (checked against the
+# lowercased command), or for the `at` rule a command starting with "at". A
+# command with none of them cannot match, so it skips the regex scan.
+_BASH_DENY_TRIGGERS: tuple[str, ...] = (
+    "git", "rm", "drop", "delete", "sudo", "mkfs", "shred", "/dev/", "nc",
+    "tee", "nohup", "crontab", "find", "chmod", ":(", "|", ">", ";", "&",
+)
+
+
+def _has_deny_trigger(command: str) -> bool:
+    """Cheap prefilter: False means no deny rule can match ``command``."""
+    lowered = command.lower()
+    return lowered.startswith("at") or any(t in lowered for t in _BASH_DENY_TRIGGERS)
+
 
+def _compile_combined(
+    rules: tuple[tuple[re.Pattern[str], str], ...],
+) -> tuple[re.Pattern[str], dict[str, str]]:
+    """Fold the deny rules into one alternation of named groups.
 
+    Each rule becomes ``(?P<r<i>>...)`` so a single ``search()`` scans the
+    command once and ``lastgroup`` identifies which rule fired. Per-rule
+    IGNORECASE is preserved with a scoped ``(?i:...)`` group.
+
+    The alternation reports the leftmost match, not the first rule in table
+    order, so a hit only proves *some* rule fires; see ``_check_bash_command``.
+    """
+    parts: list[str] = []
+    reasons: dict[str, str] = {}
+    for i, (pattern, reason) in enumerate(rules):
+        source = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            source = f"(?i:{source})"
+        name = f"r{i}"
+        parts.append(f"(?P<{name}>{source})")
+        reasons[name] = reason
+    return re.compile("|".join(parts)), reasons
+
+
+_BASH_DENY_COMBINED, _BASH_DENY_REASONS = _compile_combined(_BASH_DENY_PATTERNS)
+
+
+@functools.lru_cache(maxsize=1024)
 def _check_bash_command(command: str) -> str | None:
-    """Returns denial reason if blocked, None if allowed."""
-    for pattern, reason in _BASH_DENY_PATTERNS:
+    """Returns denial reason if blocked, None if allowed.
+
+    The reason is that of the first firing rule in table order. Allowed
+    commands cost one combined scan; a denial re-checks only the rules
+    ahead of the one the combined scan hit.
+    """
+    if not _has_deny_trigger(command):
+        return None
+    match = _BASH_DENY_COMBINED.search(command)
+    literal_reason = next((r for lit, r in _BASH_DENY_LITERALS if lit in command), None)
+    hit = None if match is None else int(match.lastgroup[1:])
+    if literal_reason is not None and (hit is None or hit >= _BASH_DENY_LITERALS_AT):
+        first, fallback = _BASH_DENY_LITERALS_AT, literal_reason
+    elif match is not None:
+        first, fallback = hit, _BASH_DENY_REASONS[match.lastgroup]
+    else:
+        return None
+    for pattern, reason in _BASH_DENY_PATTERNS[:first]:
         if pattern.search(command):
             return reason
-    return None
+    return fallback
 
 
 async def swarm_can_use_tool(
@@ -89,10 +166,12 @@ async def swarm_can_use_tool(
 ) -> PermissionResultAllow | PermissionResultDeny:
     """Guard callback for swarm agents."""
     if tool_name != "Bash":
-        return PermissionResultAllow()
+        return _ALLOW
     command = tool_input.get("command", "")
+    if not command:
+        return _ALLOW
     reason = _check_bash_command(command)
     if reason is not None:
         logger.warning("Guard blocked command: %s (reason: %s)", command[:200] + ("..." if len(command) > 200 else ""), reason)
         return PermissionResultDeny(message=reason)
-    return PermissionResultAllow()
+    return _ALLOW
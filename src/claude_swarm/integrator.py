@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import errno
 import logging
+import os
+import shlex
 import shutil
 from pathlib import Path
 
@@ -133,14 +136,71 @@ async def integrate_results(
         return False, None, str(e)
 
 
+# Characters that need /bin/sh to interpret (pipes, redirects, expansion, quoting)
+_SHELL_METACHARS = frozenset("|&;<>()$`\\\"'*?[]{}~#=%!\n")
+# Builtins and keywords that may also exist as binaries on PATH but must run
+# in the shell (`time` is a keyword whose output differs from /usr/bin/time)
+_SHELL_BUILTINS = frozenset({
+    ".", ":", "alias", "cd", "command", "eval", "exec", "exit", "export", "hash",
+    "read", "set", "shift", "source", "time", "trap", "type", "ulimit", "umask",
+    "unset", "wait",
+})
+# exec failures where /bin/sh still runs the file (no shebang) or reports it its own way
+_SHELL_FALLBACK_ERRNOS = frozenset({errno.ENOEXEC, errno.EACCES})
+
+
+def _split_plain_command(command: str, cwd: Path) -> list[str] | None:
+    """Return argv if ``command`` can run without a shell, else None.
+
+    Only exec directly when the command word resolves to an executable;
+    builtins, unknown commands and anything needing shell parsing go
+    through ``/bin/sh`` so its semantics (and error messages) are kept.
+    """
+    if any(c in _SHELL_METACHARS for c in command):
+        return None
+    # sh only splits words on space/tab; \r and Unicode spaces stay literal
+    if any(c.isspace() and c not in " \t" for c in command):
+        return None
+    argv = shlex.split(command)
+    if not argv or argv[0] in _SHELL_BUILTINS:
+        return None
+    if os.sep in argv[0]:
+        # Relative paths resolve against the command's cwd, not ours
+        target = cwd / argv[0]
+        if not (os.path.isfile(target) and os.access(target, os.X_OK)):
+            return None
+    elif shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
 async def _run_command(command: str, cwd: Path) -> tuple[bool, str]:
-    """Run a shell command and return (success, output)."""
-    proc = await asyncio.create_subprocess_shell(
-        command,
-        cwd=str(cwd),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
+    """Run a shell command and return (success, output).
+
+    Plain commands (e.g. ``uv run pytest -v``) are exec'd directly to skip
+    the intermediate ``/bin/sh``; anything needing the shell goes through it.
+    """
+    proc = None
+    argv = _split_plain_command(command, cwd)
+    if argv is not None:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                cwd=str(cwd),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            # e.g. a script without a shebang: sh runs it, exec can't
+            if e.errno not in _SHELL_FALLBACK_ERRNOS:
+                raise
+    if proc is None:
+        proc = await asyncio.create_subprocess_shell(
+            command,
+            cwd=str(cwd),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
     stdout, stderr = await proc.communicate()
     output = stdout.decode() + stderr.decode()
     return proc.returncode == 0, output.strip()
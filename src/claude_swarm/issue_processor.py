@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from pathlib import Path
 
 from claude_swarm import github
@@ -34,6 +35,14 @@ def parse_issue_config(issue_data: dict, owner: str, repo_name: str) -> IssueCon
 
 _VALID_OVERSIGHT = {level.value for level in OversightLevel}
 
+_LABEL_RE = re.compile(r"^(oversight|model|workers|cost|worker-cost):(.*)$", re.DOTALL)
+_LABEL_FIELDS = {
+    "model": ("model", str),
+    "workers": ("max_workers", int),
+    "cost": ("max_cost", float),
+    "worker-cost": ("max_worker_cost", float),
+}
+
 
 def _parse_label_config(labels: list[str]) -> dict:
     """Extract config overrides from labels.
@@ -45,31 +54,24 @@ def _parse_label_config(labels: list[str]) -> dict:
       - cost:100
       - worker-cost:5
     """
+    # Processed in order: a later label overrides an earlier one with the same prefix
     overrides: dict = {}
     for label in labels:
-        if label.startswith("oversight:"):
-            value = label.split(":", 1)[1]
+        m = _LABEL_RE.match(label)
+        if m is None:
+            continue
+        prefix, value = m.groups()
+        if prefix == "oversight":
             if value in _VALID_OVERSIGHT:
                 overrides["oversight"] = value
             else:
                 logger.warning("Ignoring invalid oversight label: %s", label)
-        elif label.startswith("model:"):
-            overrides["model"] = label.split(":", 1)[1]
-        elif label.startswith("workers:"):
-            try:
-                overrides["max_workers"] = int(label.split(":", 1)[1])
-            except ValueError:
-                pass
-        elif label.startswith("cost:"):
-            try:
-                overrides["max_cost"] = float(label.split(":", 1)[1])
-            except ValueError:
-                pass
-        elif label.startswith("worker-cost:"):
-            try:
-                overrides["max_worker_cost"] = float(label.split(":", 1)[1])
-            except ValueError:
-                pass
+            continue
+        key, convert = _LABEL_FIELDS[prefix]
+        try:
+            overrides[key] = convert(value)
+        except ValueError:
+            pass
     return overrides
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from enum import Enum
 
 from pydantic import BaseModel, Field, field_validator
@@ -60,6 +61,16 @@ class TaskPlan(BaseModel):
     build_command: str | None = Field(default=None, description="Command to build the project after integration")
 
 
+@functools.cache
+def task_plan_json_schema() -> dict:
+    """JSON schema for TaskPlan, built on first use and reused afterwards.
+
+    Pydantic regenerates the schema on every ``model_json_schema()`` call.
+    Callers must treat the returned dict as read-only.
+    """
+    return TaskPlan.model_json_schema()
+
+
 class WorkerResult(BaseModel):
     """Result from a single worker's execution."""
 
@@ -17,9 +17,17 @@ from claude_swarm.config import SwarmConfig
 from claude_swarm.errors import PlanningError, SwarmError
 from claude_swarm.guards import swarm_can_use_tool
 from claude_swarm.integrator import integrate_results
-from claude_swarm.models import RunStatus, SwarmResult, TaskPlan, WorkerResult, WorkerStatus, WorkerTask
+from claude_swarm.models import (
+    RunStatus,
+    SwarmResult,
+    TaskPlan,
+    WorkerResult,
+    WorkerStatus,
+    WorkerTask,
+    task_plan_json_schema,
+)
 from claude_swarm.coordination import CoordinationManager
-from claude_swarm.prompts import PLANNER_SYSTEM_PROMPT
+from claude_swarm.prompts import render_planner_prompt
 from claude_swarm.session import SessionRecorder
 from claude_swarm.state import StateManager
 from claude_swarm.util import run_agent
@@ -29,6 +37,8 @@ from claude_swarm.worktree import WorktreeManager
 logger = logging.getLogger(__name__)
 console = Console()
 
+WORKER_LAUNCH_STAGGER = 0.5
+
 
 class Orchestrator:
     """Manages the full swarm pipeline: plan, execute, integrate."""
@@ -69,6 +79,12 @@ class Orchestrator:
 
     async def run(self) -> SwarmResult:
         """Execute the full pipeline."""
+        try:
+            return await self._run()
+        finally:
+            self.session.close()
+
+    async def _run(self) -> SwarmResult:
         start = time.monotonic()
         console.print(f"\n[bold blue]claude-swarm[/bold blue] run [dim]{self.run_id}[/dim]")
         console.print(f"[dim]Task:[/dim] {self.config.task}\n")
@@ -260,10 +276,10 @@ class Orchestrator:
 
         plan_schema = {
             "type": "json_schema",
-            "schema": TaskPlan.model_json_schema(),
+            "schema": task_plan_json_schema(),
         }
 
-        system_prompt = PLANNER_SYSTEM_PROMPT.format(max_workers=self.config.max_workers)
+        system_prompt = render_planner_prompt(self.config.max_workers)
 
         options = ClaudeAgentOptions(
             system_prompt=system_prompt,
@@ -321,13 +337,20 @@ class Orchestrator:
         # Create worktrees sequentially to avoid git lock contention
         console.print("[blue]Creating worktrees...[/blue]")
         worktree_paths: dict[str, Path] = {}
-        for task in plan.tasks:
-            path = await self.worktree_mgr.create_worktree(task.worker_id, base_branch)
-            worktree_paths[task.worker_id] = path
-            branch = self.worktree_mgr.get_branch_name(task.worker_id)
-            self.state_mgr.register_worker(
-                self.run_id, task.worker_id, task.title, branch,
-            )
+        try:
+            for task in plan.tasks:
+                path = await self.worktree_mgr.create_worktree(task.worker_id, base_branch)
+                worktree_paths[task.worker_id] = path
+        finally:
+            # Register every worktree that exists, even if a later one failed
+            with self.state_mgr.transaction():
+                for task in plan.tasks:
+                    if task.worker_id not in worktree_paths:
+                        continue
+                    branch = self.worktree_mgr.get_branch_name(task.worker_id)
+                    self.state_mgr.register_worker(
+                        self.run_id, task.worker_id, task.title, branch,
+                    )
 
         # Launch workers with rate limiting
         console.print(f"[blue]Launching {len(plan.tasks)} worker(s)...[/blue]\n")
@@ -435,9 +458,9 @@ class Orchestrator:
                         error=str(e),
                     )
 
-        # Stagger launches by 500ms
+        # Stagger launches so workers don't all hit the API at once
         coros = [
-            launch_with_throttle(task, i * 0.5)
+            launch_with_throttle(task, i * WORKER_LAUNCH_STAGGER)
             for i, task in enumerate(plan.tasks)
         ]
 
@@ -533,3 +556,4 @@ class Orchestrator:
             self.coord_mgr.cleanup()
         except Exception as e:
             logger.error("Coordination cleanup failed: %s", e)
+        self.session.close()
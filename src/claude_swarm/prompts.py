@@ -1,5 +1,7 @@
 """System prompts for swarm agents."""
 
+import functools
+
 PLANNER_SYSTEM_PROMPT = """\
 You are the planning agent for claude-swarm. Your job is to analyze a codebase and \
 decompose a task into parallel subtasks that can be executed by independent worker agents.
@@ -279,3 +281,9 @@ have conflicting changes. Your job is to resolve the git merge conflicts.
 - Do not discard either side's work unless truly incompatible
 - Use clear commit messages explaining the resolution
 """
+
+
+@functools.lru_cache(maxsize=32)
+def render_planner_prompt(max_workers: int) -> str:
+    """Return PLANNER_SYSTEM_PROMPT formatted for *max_workers* (cached)."""
+    return PLANNER_SYSTEM_PROMPT.format(max_workers=max_workers)
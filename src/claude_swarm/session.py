@@ -6,7 +6,7 @@ import json
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 
 class SessionRecorder:
@@ -16,13 +16,16 @@ class SessionRecorder:
     and a summary to metadata.json at the end.
     """
 
+    # Class-level default so close()/__del__ are safe even if __init__ failed
+    _events_fh: IO[str] | None = None
+
     def __init__(self, repo_path: Path, run_id: str) -> None:
         self.run_id = run_id
         self.log_dir = repo_path / ".claude-swarm" / "logs" / run_id
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self._events_path = self.log_dir / "events.jsonl"
         self.events_path = self._events_path
-        self._start_time = time.monotonic()
+        self._start_ns = time.monotonic_ns()
         self._worker_costs: dict[str, float] = {}
         self._total_cost: float = 0.0
         self._worker_count: int = 0
@@ -33,7 +36,7 @@ class SessionRecorder:
         return datetime.now(timezone.utc).isoformat()
 
     def _elapsed_ms(self) -> int:
-        return int((time.monotonic() - self._start_time) * 1000)
+        return (time.monotonic_ns() - self._start_ns) // 1_000_000
 
     def record(self, event_type: str, data: dict[str, Any] | None = None) -> None:
         """Append an event to the JSONL log."""
@@ -43,8 +46,21 @@ class SessionRecorder:
             "event": event_type,
             **(data or {}),
         }
-        with open(self._events_path, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        # Keep one line-buffered handle open: each event is still flushed on
+        # its newline (the live dashboard tails this file), without an
+        # open/close per event.
+        if self._events_fh is None:
+            self._events_fh = open(self._events_path, "a", buffering=1)
+        self._events_fh.write(json.dumps(event) + "\n")
+
+    def close(self) -> None:
+        """Close the events file handle. A later record() reopens it."""
+        if self._events_fh is not None:
+            self._events_fh.close()
+            self._events_fh = None
+
+    def __del__(self) -> None:
+        self.close()
 
     def plan_start(self, task: str) -> None:
         self.record("plan_start", {"task": task})
@@ -108,6 +124,7 @@ class SessionRecorder:
 
     def write_metadata(self) -> None:
         """Write a summary metadata.json at the end of the session."""
+        self.close()
         metadata = {
             "run_id": self.run_id,
             "total_cost_usd": self._total_cost,
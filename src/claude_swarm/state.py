@@ -6,10 +6,11 @@ atomic writes, run/worker lifecycle tracking, and resumption queries.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -77,6 +78,8 @@ class StateManager:
         self.repo_path = repo_path.resolve()
         self._state_dir = self.repo_path / ".claude-swarm"
         self._state_path = self._state_dir / "state.json"
+        # Set while inside transaction(): load() returns it, save() defers
+        self._tx_state: SwarmState | None = None
 
     def _now(self) -> str:
         return datetime.now(timezone.utc).isoformat()
@@ -85,17 +88,47 @@ class StateManager:
 
     def load(self) -> SwarmState:
         """Load state from disk, creating a new empty state if missing."""
+        if self._tx_state is not None:
+            return self._tx_state
         if not self._state_path.exists():
             return SwarmState()
         try:
-            data = json.loads(self._state_path.read_text())
-            return SwarmState.model_validate(data)
-        except (json.JSONDecodeError, ValueError) as e:
+            # Single pass: pydantic parses and validates the raw bytes directly
+            return SwarmState.model_validate_json(self._state_path.read_bytes())
+        except ValueError as e:
             logger.warning("Corrupt state file, starting fresh: %s", e)
             return SwarmState()
 
     def save(self, state: SwarmState) -> None:
-        """Atomically write state to disk via os.replace."""
+        """Atomically write state to disk via os.replace.
+
+        Inside transaction() the write is deferred until the block exits.
+        """
+        if self._tx_state is not None:
+            self._tx_state = state
+            return
+        self._write(state)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Load once, apply every mutation in memory, save once on exit.
+
+        Nested blocks join the outer transaction. Nothing is written if the
+        block raises. Do not await inside the block: other coroutines (and
+        other processes) would not see the pending changes.
+        """
+        if self._tx_state is not None:
+            yield
+            return
+        self._tx_state = self.load()
+        try:
+            yield
+            state = self._tx_state
+        finally:
+            self._tx_state = None
+        self._write(state)
+
+    def _write(self, state: SwarmState) -> None:
         self._state_dir.mkdir(parents=True, exist_ok=True)
         data = state.model_dump_json(indent=2)
         fd, tmp_path = tempfile.mkstemp(
@@ -136,8 +136,9 @@ async def spawn_worker_with_retry(
 
     for attempt in range(1, max_retries + 1):
         current_model = model
-        # On later attempts, escalate model if enabled and previous attempt failed
-        if attempt > 1 and enable_escalation and last_result and not last_result.success:
+        # Escalate only on the final retry: earlier retries stay on the cheaper
+        # model, which now has the previous error as context
+        if attempt == max_retries and attempt > 1 and enable_escalation and last_result and not last_result.success:
             current_model = escalation_model
 
         # Build retry context if this isn't the first attempt
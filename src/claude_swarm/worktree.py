@@ -87,7 +87,9 @@ class WorktreeManager:
     async def create_worktree(self, worker_id: str, base_branch: str) -> Path:
         """Create an isolated worktree for a worker.
 
-        Returns the path to the new worktree.
+        Returns the path to the new worktree. Don't call this concurrently
+        for the same repo: ``git worktree add`` reads sibling worktrees'
+        admin dirs and can fail on one that is still being created.
         """
         worktree_dir = self.repo_path / ".swarm-worktrees" / self.run_id / worker_id
         branch_name = f"swarm/{self.run_id}/{worker_id}"
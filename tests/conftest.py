@@ -2,28 +2,48 @@
 
 from __future__ import annotations
 
+import json
+import shutil
 import subprocess
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture()
-def tmp_git_repo(tmp_path: Path) -> Path:
-    """Create a real temporary git repo with an initial commit."""
-    repo = tmp_path / "repo"
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the initial-commit repo once per session; tests get copies."""
+    repo = tmp_path_factory.mktemp("template") / "repo"
     repo.mkdir()
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Test"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, stdout=subprocess.DEVNULL)
+    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo, check=True, stdout=subprocess.DEVNULL)
+    subprocess.run(["git", "config", "user.name", "Test"], cwd=repo, check=True, stdout=subprocess.DEVNULL)
+    # Throwaway repos: skip fsync on commits/merges (copies inherit this config)
+    subprocess.run(["git", "config", "core.fsync", "none"], cwd=repo, check=True, stdout=subprocess.DEVNULL)
     readme = repo / "README.md"
     readme.write_text("# Test Repo\n")
-    subprocess.run(["git", "add", "README.md"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "add", "README.md"], cwd=repo, check=True, stdout=subprocess.DEVNULL)
+    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo, check=True, stdout=subprocess.DEVNULL)
     return repo
 
 
 @pytest.fixture()
+def tmp_git_repo(tmp_path: Path, _git_repo_template: Path) -> Path:
+    """Create a real temporary git repo with an initial commit.
+
+    Copies the session template instead of re-running git init + commit,
+    so each test still gets its own isolated repo.
+    """
+    repo = tmp_path / "repo"
+    shutil.copytree(_git_repo_template, repo, symlinks=True)
+    return repo
+
+
+class _FakeResultMessage:
+    """Attribute bag standing in for claude_agent_sdk's ResultMessage."""
+
+
+@pytest.fixture(scope="session")
 def make_result_message():
     """Factory for mock ResultMessage objects."""
 
@@ -33,10 +53,7 @@ def make_result_message():
         total_cost_usd: float | None = 0.01,
         structured_output: dict | None = None,
     ):
-        class FakeResultMessage:
-            pass
-
-        msg = FakeResultMessage()
+        msg = _FakeResultMessage()
         msg.result = result
         msg.is_error = is_error
         msg.total_cost_usd = total_cost_usd
@@ -46,9 +63,27 @@ def make_result_message():
     return _make
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
+def async_return():
+    """Factory for plain coroutine stubs that ignore their arguments.
+
+    Cheaper than AsyncMock; use AsyncMock only when the test inspects calls.
+    """
+
+    def _make(value=None):
+        async def _stub(*args, **kwargs):
+            return value
+        return _stub
+
+    return _make
+
+
+@pytest.fixture(scope="session")
 def sample_task_plan_dict() -> dict:
-    """Valid TaskPlan as raw dict for parsing tests."""
+    """Valid TaskPlan as raw dict for parsing tests.
+
+    Shared across the session: tests must copy it before mutating.
+    """
     return {
         "original_task": "Add logging",
         "reasoning": "Single worker suffices",
@@ -65,3 +100,9 @@ def sample_task_plan_dict() -> dict:
         "test_command": "pytest",
         "build_command": None,
     }
+
+
+@pytest.fixture(scope="session")
+def sample_task_plan_json(sample_task_plan_dict) -> str:
+    """``sample_task_plan_dict`` serialized once, for result-text fallback tests."""
+    return json.dumps(sample_task_plan_dict)
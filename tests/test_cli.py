@@ -163,22 +163,22 @@ def test_status_shows_run_data(runner, tmp_path):
     assert "test task" in result.output
 
 
-def test_process_cli_integration(runner, tmp_path):
+def test_process_cli_integration(runner, tmp_path, async_return):
     issue_data = {
         "number": 42,
         "title": "Test issue",
         "body": "Body text",
         "labels": [{"name": "swarm"}],
     }
-    with patch("claude_swarm.github.get_repo_slug", AsyncMock(return_value=("owner", "repo"))), \
-         patch("claude_swarm.github.get_issue", AsyncMock(return_value=issue_data)), \
+    with patch("claude_swarm.github.get_repo_slug", async_return(("owner", "repo"))), \
+         patch("claude_swarm.github.get_issue", async_return(issue_data)), \
          patch("claude_swarm.issue_processor.IssueProcessor.process", AsyncMock()) as mock_process:
         result = runner.invoke(cli, ["process", "--issue", "42", "--repo", str(tmp_path)])
         assert result.exit_code == 0
         mock_process.assert_called_once()
 
 
-def test_process_max_cost_option(runner, tmp_path):
+def test_process_max_cost_option(runner, tmp_path, async_return):
     issue_data = {
         "number": 42,
         "title": "Test issue",
@@ -192,8 +192,8 @@ def test_process_max_cost_option(runner, tmp_path):
         captured_config["max_cost"] = self.issue_config.max_cost
         captured_config["max_worker_cost"] = self.issue_config.max_worker_cost
 
-    with patch("claude_swarm.github.get_repo_slug", AsyncMock(return_value=("owner", "repo"))), \
-         patch("claude_swarm.github.get_issue", AsyncMock(return_value=issue_data)), \
+    with patch("claude_swarm.github.get_repo_slug", async_return(("owner", "repo"))), \
+         patch("claude_swarm.github.get_issue", async_return(issue_data)), \
          patch("claude_swarm.issue_processor.IssueProcessor.process", capture_process):
         result = runner.invoke(cli, [
             "process", "--issue", "42", "--repo", str(tmp_path),
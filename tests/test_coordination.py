@@ -464,7 +464,7 @@ class TestWorkerPromptSelection:
         return call_args.kwargs.get("system_prompt", "") or call_args.args[0] if call_args.args else ""
 
     @pytest.mark.asyncio
-    async def test_coordination_dir_with_messages_uses_coordination_section(self, tmp_path):
+    async def test_coordination_dir_with_messages_uses_coordination_section(self, tmp_path, async_return):
         from unittest.mock import AsyncMock, patch
 
         from claude_swarm.models import WorkerTask
@@ -481,7 +481,7 @@ class TestWorkerPromptSelection:
         fake_result.total_cost_usd = 0.01
         fake_result.result = "done"
 
-        with patch("claude_swarm.worker.run_agent", new_callable=AsyncMock, return_value=fake_result) as mock_agent, \
+        with patch("claude_swarm.worker.run_agent", async_return(fake_result)), \
              patch("claude_swarm.worker.ClaudeAgentOptions") as mock_opts:
             from claude_swarm.worker import _spawn_single_attempt
             await _spawn_single_attempt(
@@ -497,7 +497,7 @@ class TestWorkerPromptSelection:
             assert "Shared Notes (Inter-Worker Coordination)" not in system_prompt
 
     @pytest.mark.asyncio
-    async def test_notes_dir_only_uses_legacy_section(self, tmp_path):
+    async def test_notes_dir_only_uses_legacy_section(self, tmp_path, async_return):
         from unittest.mock import AsyncMock, patch
 
         from claude_swarm.models import WorkerTask
@@ -514,7 +514,7 @@ class TestWorkerPromptSelection:
         fake_result.total_cost_usd = 0.01
         fake_result.result = "done"
 
-        with patch("claude_swarm.worker.run_agent", new_callable=AsyncMock, return_value=fake_result), \
+        with patch("claude_swarm.worker.run_agent", async_return(fake_result)), \
              patch("claude_swarm.worker.ClaudeAgentOptions") as mock_opts:
             from claude_swarm.worker import _spawn_single_attempt
             await _spawn_single_attempt(
@@ -526,7 +526,7 @@ class TestWorkerPromptSelection:
             assert "Coordination (Inter-Worker Communication)" not in system_prompt
 
     @pytest.mark.asyncio
-    async def test_no_dirs_uses_no_coordination_section(self, tmp_path):
+    async def test_no_dirs_uses_no_coordination_section(self, tmp_path, async_return):
         from unittest.mock import AsyncMock, patch
 
         from claude_swarm.models import WorkerTask
@@ -540,7 +540,7 @@ class TestWorkerPromptSelection:
         fake_result.total_cost_usd = 0.01
         fake_result.result = "done"
 
-        with patch("claude_swarm.worker.run_agent", new_callable=AsyncMock, return_value=fake_result), \
+        with patch("claude_swarm.worker.run_agent", async_return(fake_result)), \
              patch("claude_swarm.worker.ClaudeAgentOptions") as mock_opts:
             from claude_swarm.worker import _spawn_single_attempt
             await _spawn_single_attempt(task, worktree)
@@ -549,7 +549,7 @@ class TestWorkerPromptSelection:
             assert "Coordination" not in system_prompt
 
     @pytest.mark.asyncio
-    async def test_coupled_with_appends_coupling_section(self, tmp_path):
+    async def test_coupled_with_appends_coupling_section(self, tmp_path, async_return):
         from unittest.mock import AsyncMock, patch
 
         from claude_swarm.models import WorkerTask
@@ -570,7 +570,7 @@ class TestWorkerPromptSelection:
         fake_result.total_cost_usd = 0.01
         fake_result.result = "done"
 
-        with patch("claude_swarm.worker.run_agent", new_callable=AsyncMock, return_value=fake_result), \
+        with patch("claude_swarm.worker.run_agent", async_return(fake_result)), \
              patch("claude_swarm.worker.ClaudeAgentOptions") as mock_opts:
             from claude_swarm.worker import _spawn_single_attempt
             await _spawn_single_attempt(
@@ -7,6 +7,7 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
 from rich.console import Console
 
 from claude_swarm.dashboard import (
@@ -15,6 +16,7 @@ from claude_swarm.dashboard import (
     _format_event,
     _tail_events,
 )
+from claude_swarm.models import RunStatus, WorkerStatus
 
 
 # ── _format_elapsed ────────────────────────────────────────────────
@@ -54,6 +56,25 @@ class TestFormatElapsed:
 # ── _tail_events ───────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="session")
+def ten_events_file(tmp_path_factory) -> Path:
+    """Read-only events.jsonl with ten numbered events, written once per session."""
+    events_file = tmp_path_factory.mktemp("events") / "events.jsonl"
+    events_file.write_bytes(
+        b"\n".join(json.dumps({"event": f"event-{i}", "i": i}).encode() for i in range(10)) + b"\n"
+    )
+    return events_file
+
+
+@pytest.fixture(scope="session")
+def large_events_file(tmp_path_factory) -> Path:
+    """Read-only ~1MB events.jsonl, written once per session."""
+    events_file = tmp_path_factory.mktemp("events") / "events.jsonl"
+    line = json.dumps({"event": "filler", "pad": "x" * 200}).encode()
+    events_file.write_bytes(b"\n".join([line] * 5000) + b"\n")
+    return events_file
+
+
 class TestTailEvents:
     def test_nonexistent_file(self):
         assert _tail_events(Path("/tmp/nonexistent-events.jsonl")) == []
@@ -61,14 +82,8 @@ class TestTailEvents:
     def test_none_path(self):
         assert _tail_events(None) == []
 
-    def test_last_n_from_many(self, tmp_path):
-        events_file = tmp_path / "events.jsonl"
-        lines = []
-        for i in range(10):
-            lines.append(json.dumps({"event": f"event-{i}", "i": i}))
-        events_file.write_text("\n".join(lines) + "\n")
-
-        result = _tail_events(events_file, n=3)
+    def test_last_n_from_many(self, ten_events_file):
+        result = _tail_events(ten_events_file, n=3)
         assert len(result) == 3
         assert result[0]["i"] == 7
         assert result[1]["i"] == 8
@@ -88,6 +103,48 @@ class TestTailEvents:
         events_file.write_text("")
         assert _tail_events(events_file) == []
 
+    def test_tail_spans_multiple_blocks(self, tmp_path):
+        events_file = tmp_path / "events.jsonl"
+        pad = "x" * 100
+        events_file.write_bytes(
+            b"\n".join(json.dumps({"i": i, "pad": pad}).encode() for i in range(20)) + b"\n"
+        )
+        result = _tail_events(events_file, n=5, block_size=64)
+        assert [e["i"] for e in result] == [15, 16, 17, 18, 19]
+
+    def test_large_file_reads_only_tail(self, large_events_file):
+        import tracemalloc
+
+        assert large_events_file.stat().st_size > 1_000_000
+
+        tracemalloc.start()
+        try:
+            result = _tail_events(large_events_file, n=3)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(result) == 3
+        assert peak < 100_000
+
+    def test_huge_line_stops_at_byte_cap(self, tmp_path):
+        import tracemalloc
+
+        events_file = tmp_path / "events.jsonl"
+        huge = json.dumps({"event": "tool_result", "pad": "x" * 2_000_000}).encode()
+        events_file.write_bytes(
+            json.dumps({"i": 0}).encode() + b"\n" + huge + b"\n" + json.dumps({"i": 1}).encode() + b"\n"
+        )
+
+        tracemalloc.start()
+        try:
+            result = _tail_events(events_file, n=3)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # The cap lands inside the huge line: only the complete line after it survives
+        assert result == [{"i": 1}]
+        assert peak < 1_000_000
+
 
 # ── _format_event ──────────────────────────────────────────────────
 
@@ -151,8 +208,6 @@ class TestFormatEvent:
 
 def _make_mock_state_mgr(run_id, workers=None, status="executing", task="test task", started_at=None):
     """Create a mock StateManager that returns a RunState-like object."""
-    from claude_swarm.models import RunStatus, WorkerStatus
-
     if started_at is None:
         started_at = datetime.now(timezone.utc).isoformat()
 
@@ -344,22 +399,14 @@ class TestLiveIntegration:
 
         with Live(dash, console=c, auto_refresh=False) as live_display:
             async def _refresh():
-                try:
-                    while True:
-                        live_display.update(dash)
-                        live_display.refresh()
-                        await asyncio.sleep(0.1)
-                except asyncio.CancelledError:
-                    pass
+                while True:
+                    live_display.update(dash)
+                    live_display.refresh()
+                    await asyncio.sleep(0.01)
 
-            refresh_task = asyncio.create_task(_refresh())
-            # Let it run for a few cycles
-            await asyncio.sleep(0.35)
-            refresh_task.cancel()
-            try:
-                await refresh_task
-            except asyncio.CancelledError:
-                pass
+            # Let it run for a few cycles; wait_for cancels it on timeout
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(_refresh(), timeout=0.05)
 
         output = c.export_text()
         assert len(output) > 0
@@ -367,6 +414,7 @@ class TestLiveIntegration:
     async def test_refresh_task_cancelled_properly(self):
         """Verify the refresh task is properly cancelled."""
         import asyncio
+        import contextlib
         from rich.live import Live
 
         mgr = _make_mock_state_mgr("run-1", workers=[])
@@ -379,16 +427,14 @@ class TestLiveIntegration:
                     while True:
                         live_display.update(dash)
                         live_display.refresh()
-                        await asyncio.sleep(0.1)
+                        await asyncio.sleep(0.01)
                 except asyncio.CancelledError:
                     pass
 
-            refresh_task = asyncio.create_task(_refresh())
-            await asyncio.sleep(0.15)
-            refresh_task.cancel()
-            try:
-                await refresh_task
-            except asyncio.CancelledError:
-                pass
+            refresh_task = asyncio.ensure_future(_refresh())
+            # _refresh swallows cancellation like the orchestrator's, so
+            # wait_for may return normally instead of raising
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(refresh_task, timeout=0.03)
 
         assert refresh_task.done()
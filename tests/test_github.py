@@ -22,6 +22,16 @@ from claude_swarm.github import (
     remove_label,
 )
 
+_ISSUES_TWO_SWARM_JSON = json.dumps([
+    {"number": 1, "title": "Test", "body": "body", "labels": [{"name": "swarm"}]},
+    {"number": 2, "title": "Test2", "body": "body2", "labels": [{"name": "swarm"}]},
+])
+_ISSUES_ONE_ACTIVE_JSON = json.dumps([
+    {"number": 1, "title": "A", "body": "", "labels": [{"name": "swarm"}]},
+    {"number": 2, "title": "B", "body": "", "labels": [{"name": "swarm"}, {"name": "swarm:active"}]},
+])
+_ISSUE_42_JSON = json.dumps({"number": 42, "title": "T", "body": "B", "labels": []})
+
 
 class TestParseRepoUrl:
     def test_ssh_url(self):
@@ -78,11 +88,7 @@ class TestGetRepoSlug:
 class TestListIssues:
     @pytest.mark.asyncio
     async def test_returns_parsed_json(self, tmp_path):
-        issues = [
-            {"number": 1, "title": "Test", "body": "body", "labels": [{"name": "swarm"}]},
-            {"number": 2, "title": "Test2", "body": "body2", "labels": [{"name": "swarm"}]},
-        ]
-        with patch("claude_swarm.github._run_gh", AsyncMock(return_value=json.dumps(issues))):
+        with patch("claude_swarm.github._run_gh", AsyncMock(return_value=_ISSUES_TWO_SWARM_JSON)):
             result = await list_issues("owner", "repo", "swarm", cwd=tmp_path)
             assert len(result) == 2
             assert result[0]["number"] == 1
@@ -101,11 +107,7 @@ class TestListIssues:
 
     @pytest.mark.asyncio
     async def test_excludes_labels(self, tmp_path):
-        issues = [
-            {"number": 1, "title": "A", "body": "", "labels": [{"name": "swarm"}]},
-            {"number": 2, "title": "B", "body": "", "labels": [{"name": "swarm"}, {"name": "swarm:active"}]},
-        ]
-        with patch("claude_swarm.github._run_gh", AsyncMock(return_value=json.dumps(issues))):
+        with patch("claude_swarm.github._run_gh", AsyncMock(return_value=_ISSUES_ONE_ACTIVE_JSON)):
             result = await list_issues(
                 "owner", "repo", "swarm",
                 exclude_labels=["swarm:active"],
@@ -163,8 +165,7 @@ class TestCloseIssue:
 class TestGetIssue:
     @pytest.mark.asyncio
     async def test_returns_parsed_issue(self, tmp_path):
-        issue = {"number": 42, "title": "T", "body": "B", "labels": []}
-        with patch("claude_swarm.github._run_gh", AsyncMock(return_value=json.dumps(issue))):
+        with patch("claude_swarm.github._run_gh", AsyncMock(return_value=_ISSUE_42_JSON)):
             result = await get_issue("owner", "repo", 42, cwd=tmp_path)
             assert result["number"] == 42
 
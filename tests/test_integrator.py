@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import shutil
 import subprocess
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -14,6 +17,7 @@ from claude_swarm.integrator import (
     _check_gh_installed,
     _run_command,
     _run_semantic_review,
+    _split_plain_command,
     create_pr,
     integrate_results,
 )
@@ -22,6 +26,81 @@ from claude_swarm.prompts import REVIEWER_SYSTEM_PROMPT
 from claude_swarm.worktree import WorktreeManager
 
 
+async def _git(cwd: Path, *args: str) -> None:
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args, cwd=cwd,
+        stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    assert proc.returncode == 0, stderr.decode()
+
+
+async def _commit_file(worktree: Path, name: str, content: str, message: str) -> None:
+    """Write a file in a worker worktree and commit it.
+
+    Worktrees start clean, so an existing file is tracked and ``commit -- <path>``
+    stages it in the same git call; only new files need a separate ``git add``.
+    """
+    path = worktree / name
+    tracked = path.exists()
+    path.write_text(content)
+    if not tracked:
+        await _git(worktree, "add", name)
+    await _git(worktree, "commit", "-m", message, "--", name)
+
+
+def _fast_import_commits(
+    repo: Path, mgr: WorktreeManager, edits: dict[str, tuple[str, str, str]],
+) -> None:
+    """Create one commit per worker branch on top of main in a single git process.
+
+    ``edits`` maps worker_id -> (file name, content, message). Branches are
+    written straight into the object store via ``git fast-import``, so no
+    worktree has to be checked out for tests that only merge them.
+    """
+    lines: list[str] = []
+    for worker_id, (name, content, message) in edits.items():
+        data = content.encode()
+        msg = message.encode()
+        lines += [
+            f"commit refs/heads/{mgr.get_branch_name(worker_id)}",
+            "committer T <t@t.com> 0 +0000",
+            f"data {len(msg)}",
+            message,
+            "from refs/heads/main",
+            f"M 100644 inline {name}",
+            f"data {len(data)}",
+            content,
+        ]
+    subprocess.run(
+        ["git", "fast-import", "--quiet"], cwd=repo, check=True,
+        input="\n".join(lines).encode() + b"\n", stdout=subprocess.DEVNULL,
+    )
+
+
+_CONFLICTING_EDITS = {
+    "w1": ("README.md", "Worker 1 was here\n", "w1 edit"),
+    "w2": ("README.md", "Worker 2 was here\n", "w2 edit"),
+}
+
+
+@pytest.fixture(scope="module")
+def _conflict_repo_template(tmp_path_factory, _git_repo_template) -> Path:
+    """Repo whose run-1 w1/w2 branches both rewrite README.md, built once per module."""
+    repo = tmp_path_factory.mktemp("conflict") / "repo"
+    shutil.copytree(_git_repo_template, repo, symlinks=True)
+    _fast_import_commits(repo, WorktreeManager(repo, "run-1"), _CONFLICTING_EDITS)
+    return repo
+
+
+@pytest.fixture()
+def conflict_repo(tmp_path, _conflict_repo_template) -> Path:
+    """Per-test copy of the conflicting-branches repo (integration mutates it)."""
+    repo = tmp_path / "repo"
+    shutil.copytree(_conflict_repo_template, repo, symlinks=True)
+    return repo
+
+
 class TestRunCommand:
     @pytest.mark.asyncio
     async def test_success(self, tmp_path):
@@ -34,6 +113,63 @@ class TestRunCommand:
         ok, output = await _run_command("false", tmp_path)
         assert ok is False
 
+    @pytest.mark.asyncio
+    async def test_shell_syntax_still_uses_shell(self, tmp_path):
+        ok, output = await _run_command("echo hello | tr a-z A-Z", tmp_path)
+        assert ok is True
+        assert output == "HELLO"
+
+    @pytest.mark.asyncio
+    async def test_missing_executable_fails(self, tmp_path):
+        ok, output = await _run_command("definitely-not-a-real-binary --flag", tmp_path)
+        assert ok is False
+        assert "definitely-not-a-real-binary" in output
+
+    @pytest.mark.parametrize("command", [":", "exit 0", "true"])
+    @pytest.mark.asyncio
+    async def test_builtins_succeed(self, tmp_path, command):
+        ok, _ = await _run_command(command, tmp_path)
+        assert ok is True
+
+    @pytest.mark.parametrize("command", ["git --version", "echo hi | cat"])
+    @pytest.mark.asyncio
+    async def test_missing_cwd_raises(self, tmp_path, command):
+        # A bad cwd is an error for both paths, never a "missing binary" result
+        with pytest.raises(FileNotFoundError):
+            await _run_command(command, tmp_path / "missing")
+
+    @pytest.mark.asyncio
+    async def test_script_without_shebang_runs(self, tmp_path):
+        # exec fails with ENOEXEC; /bin/sh runs the file as a shell script
+        script = tmp_path / "build.sh"
+        script.write_text("echo built\n")
+        script.chmod(0o755)
+        ok, output = await _run_command("./build.sh", tmp_path)
+        assert ok is True
+        assert output == "built"
+
+    def test_split_plain_command(self, tmp_path):
+        assert _split_plain_command("git status -s", tmp_path) == ["git", "status", "-s"]
+        assert _split_plain_command("pytest -k 'not slow'", tmp_path) is None
+        assert _split_plain_command("FOO=1 pytest", tmp_path) is None
+        assert _split_plain_command("cd sub", tmp_path) is None
+        assert _split_plain_command(": ", tmp_path) is None
+        assert _split_plain_command("exit 0", tmp_path) is None
+        assert _split_plain_command("time make", tmp_path) is None
+        assert _split_plain_command("git\rstatus", tmp_path) is None
+        assert _split_plain_command("definitely-not-a-real-binary", tmp_path) is None
+        assert _split_plain_command("", tmp_path) is None
+
+    def test_split_relative_path_resolves_against_cwd(self, tmp_path):
+        script = tmp_path / "run.sh"
+        script.write_text("#!/bin/sh\necho ran\n")
+        assert _split_plain_command("./run.sh", tmp_path) is None
+        script.chmod(0o755)
+        assert _split_plain_command("./run.sh -v", tmp_path) == ["./run.sh", "-v"]
+        # Directories pass X_OK but are not commands; leave them to the shell
+        (tmp_path / "somedir").mkdir()
+        assert _split_plain_command("./somedir", tmp_path) is None
+
 
 class TestCheckGhInstalled:
     def test_raises_when_missing(self):
@@ -64,20 +200,10 @@ class TestRealMerge:
         path1 = await mgr.create_worktree("w1", "main")
         path2 = await mgr.create_worktree("w2", "main")
 
-        # Worker 1: create file_a.txt
-        (path1 / "file_a.txt").write_text("from worker 1\n")
-        subprocess.run(["git", "add", "file_a.txt"], cwd=path1, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w1 work"],
-            cwd=path1, check=True, capture_output=True,
-        )
-
-        # Worker 2: create file_b.txt
-        (path2 / "file_b.txt").write_text("from worker 2\n")
-        subprocess.run(["git", "add", "file_b.txt"], cwd=path2, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w2 work"],
-            cwd=path2, check=True, capture_output=True,
+        # Worktree creation must stay sequential, but the commits are independent
+        await asyncio.gather(
+            _commit_file(path1, "file_a.txt", "from worker 1\n", "w1 work"),
+            _commit_file(path2, "file_b.txt", "from worker 2\n", "w2 work"),
         )
 
         worker_results = [
@@ -100,27 +226,9 @@ class TestRealMerge:
         assert (integration_path / "file_b.txt").exists()
 
     @pytest.mark.asyncio
-    async def test_merge_conflicting_branches(self, tmp_git_repo):
+    async def test_merge_conflicting_branches(self, conflict_repo):
         """Two workers modify the same file with conflicting content -> MergeConflictError."""
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
-
-        path1 = await mgr.create_worktree("w1", "main")
-        path2 = await mgr.create_worktree("w2", "main")
-
-        # Both workers modify README.md with different content
-        (path1 / "README.md").write_text("Worker 1 was here\n")
-        subprocess.run(["git", "add", "README.md"], cwd=path1, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w1 edit"],
-            cwd=path1, check=True, capture_output=True,
-        )
-
-        (path2 / "README.md").write_text("Worker 2 was here\n")
-        subprocess.run(["git", "add", "README.md"], cwd=path2, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w2 edit"],
-            cwd=path2, check=True, capture_output=True,
-        )
+        mgr = WorktreeManager(conflict_repo, "run-1")
 
         worker_results = [
             WorkerResult(worker_id="w1", success=True, summary="done w1"),
@@ -139,27 +247,9 @@ class TestRealMerge:
 
 class TestConflictResolution:
     @pytest.mark.asyncio
-    async def test_conflict_resolution_succeeds(self, tmp_git_repo):
+    async def test_conflict_resolution_succeeds(self, conflict_repo):
         """Mock _resolve_merge_conflict returning True -> integration succeeds."""
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
-
-        path1 = await mgr.create_worktree("w1", "main")
-        path2 = await mgr.create_worktree("w2", "main")
-
-        # Both modify README.md -> conflict
-        (path1 / "README.md").write_text("Worker 1 was here\n")
-        subprocess.run(["git", "add", "README.md"], cwd=path1, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w1 edit"],
-            cwd=path1, check=True, capture_output=True,
-        )
-
-        (path2 / "README.md").write_text("Worker 2 was here\n")
-        subprocess.run(["git", "add", "README.md"], cwd=path2, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w2 edit"],
-            cwd=path2, check=True, capture_output=True,
-        )
+        mgr = WorktreeManager(conflict_repo, "run-1")
 
         worker_results = [
             WorkerResult(worker_id="w1", success=True, summary="done w1"),
@@ -177,26 +267,9 @@ class TestConflictResolution:
         assert error is None
 
     @pytest.mark.asyncio
-    async def test_conflict_resolution_fails_raises(self, tmp_git_repo):
+    async def test_conflict_resolution_fails_raises(self, conflict_repo):
         """Mock _resolve_merge_conflict returning False -> MergeConflictError raised."""
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
-
-        path1 = await mgr.create_worktree("w1", "main")
-        path2 = await mgr.create_worktree("w2", "main")
-
-        (path1 / "README.md").write_text("Worker 1 was here\n")
-        subprocess.run(["git", "add", "README.md"], cwd=path1, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w1 edit"],
-            cwd=path1, check=True, capture_output=True,
-        )
-
-        (path2 / "README.md").write_text("Worker 2 was here\n")
-        subprocess.run(["git", "add", "README.md"], cwd=path2, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w2 edit"],
-            cwd=path2, check=True, capture_output=True,
-        )
+        mgr = WorktreeManager(conflict_repo, "run-1")
 
         worker_results = [
             WorkerResult(worker_id="w1", success=True, summary="done w1"),
@@ -223,12 +296,7 @@ class TestCreatePrPublic:
         mgr = WorktreeManager(tmp_git_repo, "run-1")
 
         path1 = await mgr.create_worktree("w1", "main")
-        (path1 / "file_a.txt").write_text("worker 1\n")
-        subprocess.run(["git", "add", "file_a.txt"], cwd=path1, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w1"],
-            cwd=path1, check=True, capture_output=True,
-        )
+        await _commit_file(path1, "file_a.txt", "worker 1\n", "w1")
 
         worker_results = [WorkerResult(worker_id="w1", success=True, summary="done")]
 
@@ -263,41 +331,50 @@ class TestCreatePrPublic:
         assert pr_url == "https://github.com/o/r/pull/1"
 
 
+class _RunAgentStub:
+    """Records the single run_agent call made by _run_semantic_review."""
+
+    def __init__(self) -> None:
+        self.kwargs: dict | None = None
+
+    async def __call__(self, **kwargs):
+        self.kwargs = kwargs
+        return SimpleNamespace(is_error=False)
+
+
 class TestSemanticReview:
     async def test_calls_run_agent_with_correct_options(self, tmp_path):
-        with patch("claude_swarm.integrator.run_agent", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = AsyncMock(is_error=False)
+        stub = _RunAgentStub()
+        with patch("claude_swarm.integrator.run_agent", stub):
             await _run_semantic_review(tmp_path, "opus")
-            options = mock_run.call_args.kwargs["options"]
-            assert options.system_prompt == REVIEWER_SYSTEM_PROMPT
-            assert options.model == "opus"
-            assert options.max_budget_usd == 3.0
-            assert options.max_turns == 20
-            assert options.cwd == str(tmp_path)
-            assert options.can_use_tool is swarm_can_use_tool
+        options = stub.kwargs["options"]
+        assert options.system_prompt == REVIEWER_SYSTEM_PROMPT
+        assert options.model == "opus"
+        assert options.max_budget_usd == 3.0
+        assert options.max_turns == 20
+        assert options.cwd == str(tmp_path)
+        assert options.can_use_tool is swarm_can_use_tool
 
     async def test_forwards_notes_summary(self, tmp_path):
-        with patch("claude_swarm.integrator.run_agent", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = AsyncMock(is_error=False)
+        stub = _RunAgentStub()
+        with patch("claude_swarm.integrator.run_agent", stub):
             await _run_semantic_review(tmp_path, "opus", notes_summary="Worker notes here")
-            prompt = mock_run.call_args.kwargs["prompt"]
-            assert "Worker notes here" in prompt
+        assert "Worker notes here" in stub.kwargs["prompt"]
 
     async def test_no_notes_summary(self, tmp_path):
-        with patch("claude_swarm.integrator.run_agent", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = AsyncMock(is_error=False)
+        stub = _RunAgentStub()
+        with patch("claude_swarm.integrator.run_agent", stub):
             await _run_semantic_review(tmp_path, "opus", notes_summary="")
-            prompt = mock_run.call_args.kwargs["prompt"]
-            # Should be the base prompt only, no extra newline/notes
-            assert prompt == "Review the merged changes for semantic conflicts and fix any issues you find."
+        # Should be the base prompt only, no extra newline/notes
+        assert stub.kwargs["prompt"] == "Review the merged changes for semantic conflicts and fix any issues you find."
 
     async def test_reviewer_allowed_tools(self, tmp_path):
-        with patch("claude_swarm.integrator.run_agent", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = AsyncMock(is_error=False)
+        stub = _RunAgentStub()
+        with patch("claude_swarm.integrator.run_agent", stub):
             await _run_semantic_review(tmp_path, "opus")
-            options = mock_run.call_args.kwargs["options"]
-            assert options.allowed_tools == ["Read", "Write", "Edit", "Bash", "Glob", "Grep"]
-            assert options.permission_mode == "acceptEdits"
+        options = stub.kwargs["options"]
+        assert options.allowed_tools == ["Read", "Write", "Edit", "Bash", "Glob", "Grep"]
+        assert options.permission_mode == "acceptEdits"
 
 
 class TestIntegrateResultsWithReview:
@@ -305,12 +382,7 @@ class TestIntegrateResultsWithReview:
         mgr = WorktreeManager(tmp_git_repo, "run-1")
 
         path1 = await mgr.create_worktree("w1", "main")
-        (path1 / "file_a.txt").write_text("from worker 1\n")
-        subprocess.run(["git", "add", "file_a.txt"], cwd=path1, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w1 work"],
-            cwd=path1, check=True, capture_output=True,
-        )
+        await _commit_file(path1, "file_a.txt", "from worker 1\n", "w1 work")
 
         worker_results = [WorkerResult(worker_id="w1", success=True, summary="done w1")]
 
@@ -331,12 +403,7 @@ class TestIntegrateResultsWithReview:
         mgr = WorktreeManager(tmp_git_repo, "run-1")
 
         path1 = await mgr.create_worktree("w1", "main")
-        (path1 / "file_a.txt").write_text("from worker 1\n")
-        subprocess.run(["git", "add", "file_a.txt"], cwd=path1, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "w1 work"],
-            cwd=path1, check=True, capture_output=True,
-        )
+        await _commit_file(path1, "file_a.txt", "from worker 1\n", "w1 work")
 
         worker_results = [WorkerResult(worker_id="w1", success=True, summary="done w1")]
 
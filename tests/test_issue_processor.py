@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import DEFAULT, AsyncMock, patch
 
 import pytest
 
@@ -36,22 +36,35 @@ def _make_issue_data(
 
 
 def _make_swarm_result(run_id: str = "test-run", pr_url: str | None = None) -> SwarmResult:
-    plan = TaskPlan(
+    # Trusted literals: model_construct skips validation (test_models covers that)
+    plan = TaskPlan.model_construct(
         original_task="task",
         reasoning="r",
-        tasks=[WorkerTask(worker_id="w1", title="t", description="d")],
+        tasks=[WorkerTask.model_construct(worker_id="w1", title="t", description="d")],
     )
-    return SwarmResult(
+    return SwarmResult.model_construct(
         run_id=run_id,
         task="task",
         plan=plan,
-        worker_results=[WorkerResult(worker_id="w1", success=True, cost_usd=0.50)],
+        worker_results=[WorkerResult.model_construct(worker_id="w1", success=True, cost_usd=0.50)],
         integration_success=True,
         pr_url=pr_url,
         total_cost_usd=0.50,
     )
 
 
+@pytest.fixture(scope="module")
+def basic_issue_config() -> IssueConfig:
+    """A validated IssueConfig shared by tests that only read it.
+
+    Use ``model_copy(update=...)`` for variants rather than mutating it.
+    """
+    return IssueConfig(
+        issue_number=1, owner="o", repo_name="r",
+        title="T", body="B",
+    )
+
+
 class TestParseIssueConfig:
     def test_basic_issue(self):
         data = _make_issue_data()
@@ -121,6 +134,17 @@ class TestParseLabelConfig:
         result = _parse_label_config(["worker-cost:5.0"])
         assert result["max_worker_cost"] == 5.0
 
+    def test_later_label_wins(self):
+        assert _parse_label_config(["model:haiku", "model:opus"])["model"] == "opus"
+        assert _parse_label_config(["model:opus", "model:haiku"])["model"] == "haiku"
+
+    def test_invalid_oversight_warns_every_time(self, caplog):
+        for _ in range(2):
+            caplog.clear()
+            with caplog.at_level("WARNING", logger="claude_swarm.issue_processor"):
+                assert _parse_label_config(["oversight:bogus"]) == {}
+            assert "Ignoring invalid oversight label" in caplog.text
+
 
 class TestIssueConfigToSwarmConfig:
     def test_defaults(self):
@@ -166,38 +190,25 @@ class TestIssueConfigToSwarmConfig:
 
 class TestIssueProcessor:
     @pytest.mark.asyncio
-    async def test_claim_swaps_labels(self, tmp_path):
-        ic = IssueConfig(
-            issue_number=1, owner="o", repo_name="r",
-            title="T", body="B",
-        )
-        processor = IssueProcessor(ic, tmp_path)
-        with patch("claude_swarm.github.remove_label", AsyncMock()) as rm, \
-             patch("claude_swarm.github.add_label", AsyncMock()) as add:
+    async def test_claim_swaps_labels(self, tmp_path, basic_issue_config):
+        processor = IssueProcessor(basic_issue_config, tmp_path)
+        with patch.multiple("claude_swarm.github", remove_label=DEFAULT, add_label=DEFAULT) as gh:
             result = await processor.claim()
             assert result is True
-            rm.assert_called_once_with("o", "r", 1, "swarm", cwd=tmp_path)
-            add.assert_called_once_with("o", "r", 1, "swarm:active", cwd=tmp_path)
+            gh["remove_label"].assert_called_once_with("o", "r", 1, "swarm", cwd=tmp_path)
+            gh["add_label"].assert_called_once_with("o", "r", 1, "swarm:active", cwd=tmp_path)
 
     @pytest.mark.asyncio
-    async def test_claim_fails_returns_false(self, tmp_path):
+    async def test_claim_fails_returns_false(self, tmp_path, basic_issue_config):
         from claude_swarm.errors import GitHubError
-        ic = IssueConfig(
-            issue_number=1, owner="o", repo_name="r",
-            title="T", body="B",
-        )
-        processor = IssueProcessor(ic, tmp_path)
+        processor = IssueProcessor(basic_issue_config, tmp_path)
         with patch("claude_swarm.github.remove_label", AsyncMock(side_effect=GitHubError("nope"))):
             result = await processor.claim()
             assert result is False
 
     @pytest.mark.asyncio
-    async def test_process_success_flow(self, tmp_path):
-        ic = IssueConfig(
-            issue_number=1, owner="o", repo_name="r",
-            title="T", body="B",
-        )
-        processor = IssueProcessor(ic, tmp_path)
+    async def test_process_success_flow(self, tmp_path, basic_issue_config):
+        processor = IssueProcessor(basic_issue_config, tmp_path)
         result = _make_swarm_result(pr_url="https://github.com/o/r/pull/1")
 
         with patch.object(processor, "claim", AsyncMock(return_value=True)), \
@@ -209,12 +220,8 @@ class TestIssueProcessor:
             mark_done.assert_called_once_with(result.pr_url)
 
     @pytest.mark.asyncio
-    async def test_process_failure_posts_error(self, tmp_path):
-        ic = IssueConfig(
-            issue_number=1, owner="o", repo_name="r",
-            title="T", body="B",
-        )
-        processor = IssueProcessor(ic, tmp_path)
+    async def test_process_failure_posts_error(self, tmp_path, basic_issue_config):
+        processor = IssueProcessor(basic_issue_config, tmp_path)
 
         with patch.object(processor, "claim", AsyncMock(return_value=True)), \
              patch.object(processor, "_run_swarm", AsyncMock(side_effect=RuntimeError("boom"))), \
@@ -223,57 +230,44 @@ class TestIssueProcessor:
             mark_failed.assert_called_once_with("boom")
 
     @pytest.mark.asyncio
-    async def test_mark_done_closes_issue(self, tmp_path):
-        ic = IssueConfig(
-            issue_number=1, owner="o", repo_name="r",
-            title="T", body="B",
-        )
-        processor = IssueProcessor(ic, tmp_path)
-        with patch("claude_swarm.github.remove_label", AsyncMock()), \
-             patch("claude_swarm.github.add_label", AsyncMock()) as add, \
-             patch("claude_swarm.github.close_issue", AsyncMock()) as close:
+    async def test_mark_done_closes_issue(self, tmp_path, basic_issue_config, async_return):
+        processor = IssueProcessor(basic_issue_config, tmp_path)
+        with patch.multiple(
+            "claude_swarm.github",
+            remove_label=async_return(), add_label=DEFAULT, close_issue=DEFAULT,
+        ) as gh:
             await processor._mark_done("https://github.com/o/r/pull/1")
-            add.assert_called_once_with("o", "r", 1, "swarm:done", cwd=tmp_path)
-            close.assert_called_once()
+            gh["add_label"].assert_called_once_with("o", "r", 1, "swarm:done", cwd=tmp_path)
+            gh["close_issue"].assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_mark_failed_leaves_open(self, tmp_path):
-        ic = IssueConfig(
-            issue_number=1, owner="o", repo_name="r",
-            title="T", body="B",
-        )
-        processor = IssueProcessor(ic, tmp_path)
-        with patch("claude_swarm.github.post_comment", AsyncMock()), \
-             patch("claude_swarm.github.remove_label", AsyncMock()), \
-             patch("claude_swarm.github.add_label", AsyncMock()) as add, \
-             patch("claude_swarm.github.close_issue", AsyncMock()) as close:
+    async def test_mark_failed_leaves_open(self, tmp_path, basic_issue_config, async_return):
+        processor = IssueProcessor(basic_issue_config, tmp_path)
+        with patch.multiple(
+            "claude_swarm.github",
+            post_comment=async_return(), remove_label=async_return(),
+            add_label=DEFAULT, close_issue=DEFAULT,
+        ) as gh:
             await processor._mark_failed("oops")
-            add.assert_called_once_with("o", "r", 1, "swarm:failed", cwd=tmp_path)
-            close.assert_not_called()
+            gh["add_label"].assert_called_once_with("o", "r", 1, "swarm:failed", cwd=tmp_path)
+            gh["close_issue"].assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_mark_failed_escapes_backticks(self, tmp_path):
-        ic = IssueConfig(
-            issue_number=1, owner="o", repo_name="r",
-            title="T", body="B",
-        )
-        processor = IssueProcessor(ic, tmp_path)
-        with patch("claude_swarm.github.post_comment", AsyncMock()) as mock_comment, \
-             patch("claude_swarm.github.remove_label", AsyncMock()), \
-             patch("claude_swarm.github.add_label", AsyncMock()):
+    async def test_mark_failed_escapes_backticks(self, tmp_path, basic_issue_config, async_return):
+        processor = IssueProcessor(basic_issue_config, tmp_path)
+        with patch.multiple(
+            "claude_swarm.github",
+            post_comment=DEFAULT, remove_label=async_return(), add_label=async_return(),
+        ) as gh:
             await processor._mark_failed("error with ``` backticks ```")
-            posted_body = mock_comment.call_args[0][3]
+            posted_body = gh["post_comment"].call_args[0][3]
             # The error body should not contain raw triple backticks from user input
             assert "``` backticks ```" not in posted_body
             assert "` ` ` backticks ` ` `" in posted_body
 
     @pytest.mark.asyncio
-    async def test_post_result_comment_format(self, tmp_path):
-        ic = IssueConfig(
-            issue_number=1, owner="o", repo_name="r",
-            title="T", body="B",
-        )
-        processor = IssueProcessor(ic, tmp_path)
+    async def test_post_result_comment_format(self, tmp_path, basic_issue_config):
+        processor = IssueProcessor(basic_issue_config, tmp_path)
         result = _make_swarm_result(
             run_id="test-run",
             pr_url="https://github.com/o/r/pull/1",
@@ -295,9 +289,9 @@ class TestIssueWatcher:
 
         with patch("claude_swarm.github.list_issues", AsyncMock(return_value=issues)), \
              patch("claude_swarm.issue_processor.IssueProcessor") as MockProcessor:
-            mock_instance = MagicMock()
+            # The patch already provides a MagicMock instance; only process() must be awaitable
+            mock_instance = MockProcessor.return_value
             mock_instance.process = AsyncMock()
-            MockProcessor.return_value = mock_instance
 
             count = await watcher._poll_once()
             assert count == 1
@@ -311,15 +305,17 @@ class TestIssueWatcher:
             assert count == 0
 
     @pytest.mark.asyncio
-    async def test_stop_breaks_loop(self, tmp_path):
+    async def test_stop_breaks_loop(self, tmp_path, async_return):
         watcher = IssueWatcher(tmp_path, "o", "r", interval=1)
 
-        async def stop_after_start():
-            await asyncio.sleep(0.1)
+        async def poll_then_stop():
+            # Stop as soon as the first poll happens: no fixed sleep, and the
+            # loop must skip its inter-poll wait once stopped
             watcher.stop()
+            return 0
 
-        with patch("claude_swarm.github.ensure_labels_exist", AsyncMock()), \
-             patch.object(watcher, "_poll_once", AsyncMock(return_value=0)):
-            # Run watcher and stop concurrently
-            await asyncio.gather(watcher.run(), stop_after_start())
+        with patch("claude_swarm.github.ensure_labels_exist", async_return()), \
+             patch.object(watcher, "_poll_once", AsyncMock(side_effect=poll_then_stop)) as poll:
+            await asyncio.wait_for(watcher.run(), timeout=0.5)
+        poll.assert_called_once()
         assert watcher._running is False
@@ -5,7 +5,14 @@ import json
 import pytest
 from pydantic import ValidationError
 
-from claude_swarm.models import IssueConfig, SwarmResult, TaskPlan, WorkerResult, WorkerTask
+from claude_swarm.models import (
+    IssueConfig,
+    SwarmResult,
+    TaskPlan,
+    WorkerResult,
+    WorkerTask,
+    task_plan_json_schema,
+)
 
 
 class TestWorkerTask:
@@ -87,6 +94,10 @@ class TestTaskPlan:
         assert "properties" in schema
         assert "tasks" in schema["properties"]
 
+    def test_cached_json_schema(self):
+        assert task_plan_json_schema() == TaskPlan.model_json_schema()
+        assert task_plan_json_schema() is task_plan_json_schema()
+
     def test_roundtrip(self):
         p = TaskPlan(
             original_task="task",
@@ -11,11 +11,6 @@ from pydantic import ValidationError
 from claude_swarm.notes import NoteManager, SharedNote
 
 
-def _write_note(notes_dir: Path, worker_id: str, data: dict) -> None:
-    """Helper: write a JSON note file."""
-    (notes_dir / f"{worker_id}.json").write_text(json.dumps(data))
-
-
 def _valid_note_dict(**overrides) -> dict:
     defaults = {
         "worker_id": "w1",
@@ -28,6 +23,16 @@ def _valid_note_dict(**overrides) -> dict:
     return defaults
 
 
+_VALID_NOTE = _valid_note_dict()
+_VALID_NOTE_JSON = json.dumps(_VALID_NOTE)
+
+
+def _write_note(notes_dir: Path, worker_id: str, data: dict | None = None) -> None:
+    """Helper: write a JSON note file (the default valid note if no data)."""
+    text = _VALID_NOTE_JSON if data is None else json.dumps(data)
+    (notes_dir / f"{worker_id}.json").write_text(text)
+
+
 class TestSharedNote:
     def test_minimal_note(self):
         note = SharedNote(
@@ -50,7 +55,7 @@ class TestSharedNote:
         assert note.tags == ["api", "naming"]
 
     def test_roundtrip_json(self):
-        note = SharedNote(**_valid_note_dict())
+        note = SharedNote.model_validate(_VALID_NOTE)
         json_str = note.model_dump_json()
         note2 = SharedNote.model_validate_json(json_str)
         assert note2.worker_id == note.worker_id
@@ -87,7 +92,7 @@ class TestNoteManagerRead:
     def test_read_valid(self, tmp_path):
         mgr = NoteManager(tmp_path, "run-1")
         notes_dir = mgr.setup()
-        _write_note(notes_dir, "w1", _valid_note_dict())
+        _write_note(notes_dir, "w1")
         note = mgr.read_note("w1")
         assert note is not None
         assert note.worker_id == "w1"
@@ -107,7 +112,7 @@ class TestNoteManagerRead:
     def test_read_all_notes(self, tmp_path):
         mgr = NoteManager(tmp_path, "run-1")
         notes_dir = mgr.setup()
-        _write_note(notes_dir, "w1", _valid_note_dict(worker_id="w1"))
+        _write_note(notes_dir, "w1")
         _write_note(notes_dir, "w2", _valid_note_dict(worker_id="w2", topic="db"))
         notes = mgr.read_all_notes()
         assert len(notes) == 2
@@ -121,7 +126,7 @@ class TestNoteManagerRead:
     def test_read_all_skips_invalid(self, tmp_path):
         mgr = NoteManager(tmp_path, "run-1")
         notes_dir = mgr.setup()
-        _write_note(notes_dir, "w1", _valid_note_dict(worker_id="w1"))
+        _write_note(notes_dir, "w1")
         (notes_dir / "w2.json").write_text("broken")
         notes = mgr.read_all_notes()
         assert len(notes) == 1
@@ -132,8 +137,8 @@ class TestNoteManagerList:
     def test_list_note_files(self, tmp_path):
         mgr = NoteManager(tmp_path, "run-1")
         notes_dir = mgr.setup()
-        _write_note(notes_dir, "w1", _valid_note_dict())
-        _write_note(notes_dir, "w2", _valid_note_dict())
+        _write_note(notes_dir, "w1")
+        _write_note(notes_dir, "w2")
         assert mgr.list_note_files() == ["w1", "w2"]
 
 
@@ -177,7 +182,7 @@ class TestNoteManagerCleanup:
     def test_cleanup_removes_dir(self, tmp_path):
         mgr = NoteManager(tmp_path, "run-1")
         notes_dir = mgr.setup()
-        _write_note(notes_dir, "w1", _valid_note_dict())
+        _write_note(notes_dir, "w1")
         assert notes_dir.exists()
         mgr.cleanup()
         assert not notes_dir.exists()
@@ -194,8 +199,11 @@ class TestBackwardCompatShim:
 
     def test_notemanager_has_coordination_methods(self, tmp_path):
         mgr = NoteManager(tmp_path, "run-1")
-        assert hasattr(mgr, "coordination_dir")
-        assert hasattr(mgr, "read_inbox")
-        assert hasattr(mgr, "read_all_messages")
-        assert hasattr(mgr, "read_all_statuses")
-        assert hasattr(mgr, "format_coordination_summary")
+        expected = {
+            "coordination_dir",
+            "read_inbox",
+            "read_all_messages",
+            "read_all_statuses",
+            "format_coordination_summary",
+        }
+        assert expected - set(dir(mgr)) == set()
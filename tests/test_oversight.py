@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,7 +12,10 @@ from click.testing import CliRunner
 
 from claude_swarm.cli import cli
 from claude_swarm.config import SwarmConfig
+from claude_swarm.integrator import auto_merge_pr
 from claude_swarm.models import OversightLevel, RunStatus
+from claude_swarm.orchestrator import Orchestrator
+from claude_swarm.state import StateManager
 
 
 # ---------------------------------------------------------------------------
@@ -56,24 +61,26 @@ class TestCLIOversight:
     def runner(self):
         return CliRunner()
 
+    @pytest.fixture()
+    def mock_orch_cls(self):
+        """Patch Orchestrator with a mock whose instance has an awaitable run()."""
+        with patch("claude_swarm.orchestrator.Orchestrator") as MockOrch:
+            MockOrch.return_value.run = AsyncMock()
+            yield MockOrch
+
     def test_option_registered(self, runner):
         result = runner.invoke(cli, ["run", "--help"])
         assert result.exit_code == 0
         assert "--oversight" in result.output
 
-    def test_passed_to_config(self, runner, tmp_path):
-        with patch("claude_swarm.orchestrator.Orchestrator") as MockOrch:
-            mock_instance = MagicMock()
-            mock_instance.run = AsyncMock()
-            MockOrch.return_value = mock_instance
-
-            result = runner.invoke(cli, [
-                "run", "test task", "--repo", str(tmp_path),
-                "--oversight", "autonomous",
-            ])
-            assert result.exit_code == 0
-            config = MockOrch.call_args[0][0]
-            assert config.oversight == "autonomous"
+    def test_passed_to_config(self, runner, tmp_path, mock_orch_cls):
+        result = runner.invoke(cli, [
+            "run", "test task", "--repo", str(tmp_path),
+            "--oversight", "autonomous",
+        ])
+        assert result.exit_code == 0
+        config = mock_orch_cls.call_args[0][0]
+        assert config.oversight == "autonomous"
 
     def test_autonomous_requires_pr(self, runner, tmp_path):
         result = runner.invoke(cli, [
@@ -83,40 +90,41 @@ class TestCLIOversight:
         assert result.exit_code != 0
         assert "incompatible" in result.output.lower() or "Usage" in result.output
 
-    def test_checkpoint_passed(self, runner, tmp_path):
-        with patch("claude_swarm.orchestrator.Orchestrator") as MockOrch:
-            mock_instance = MagicMock()
-            mock_instance.run = AsyncMock()
-            MockOrch.return_value = mock_instance
-
-            result = runner.invoke(cli, [
-                "run", "test task", "--repo", str(tmp_path),
-                "--oversight", "checkpoint",
-            ])
-            assert result.exit_code == 0
-            config = MockOrch.call_args[0][0]
-            assert config.oversight == "checkpoint"
+    def test_checkpoint_passed(self, runner, tmp_path, mock_orch_cls):
+        result = runner.invoke(cli, [
+            "run", "test task", "--repo", str(tmp_path),
+            "--oversight", "checkpoint",
+        ])
+        assert result.exit_code == 0
+        config = mock_orch_cls.call_args[0][0]
+        assert config.oversight == "checkpoint"
 
 
 # ---------------------------------------------------------------------------
 # TestCheckpointMode
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def _checkpoint_orch_templates(tmp_path_factory):
+    """One Orchestrator per oversight level, built once for the checkpoint tests."""
+    repo_path = tmp_path_factory.mktemp("checkpoint")
+    templates = {}
+    with patch("claude_swarm.orchestrator.SessionRecorder"), \
+         patch("claude_swarm.orchestrator.WorktreeManager"), \
+         patch("claude_swarm.orchestrator.StateManager"):
+        for oversight in ("checkpoint", "pr-gated"):
+            config = SwarmConfig(task="test task", repo_path=repo_path, oversight=oversight)
+            templates[oversight] = Orchestrator(config, run_id="test-run")
+    return templates
+
+
 class TestCheckpointMode:
     @pytest.fixture()
-    def _make_orchestrator(self, tmp_path):
-        """Factory that creates a mocked Orchestrator for checkpoint tests."""
+    def _make_orchestrator(self, _checkpoint_orch_templates):
+        """Factory returning a shallow copy with a fresh state_mgr mock."""
         def _factory(oversight="checkpoint"):
-            config = SwarmConfig(
-                task="test task",
-                repo_path=tmp_path,
-                oversight=oversight,
-            )
-            with patch("claude_swarm.orchestrator.SessionRecorder"), \
-                 patch("claude_swarm.orchestrator.WorktreeManager"), \
-                 patch("claude_swarm.orchestrator.StateManager"):
-                from claude_swarm.orchestrator import Orchestrator
-                orch = Orchestrator(config, run_id="test-run")
+            orch = copy.copy(_checkpoint_orch_templates[oversight])
+            orch.state_mgr = MagicMock()
             return orch
         return _factory
 
@@ -165,70 +173,39 @@ class TestCheckpointMode:
 # TestAutonomousMode
 # ---------------------------------------------------------------------------
 
+def _make_proc_mock(stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0) -> AsyncMock:
+    """Fake asyncio Process whose communicate() returns (stdout, stderr)."""
+    proc = AsyncMock(spec=asyncio.subprocess.Process)
+    proc.communicate.return_value = (stdout, stderr)
+    proc.returncode = returncode
+    return proc
+
+
 class TestAutonomousMode:
+    @pytest.mark.parametrize(
+        ("stdout", "stderr", "returncode", "expected"),
+        [
+            pytest.param(b"", b"", 0, True, id="called_after_pr"),
+            pytest.param(b"ok", b"", 0, True, id="gh_auto_succeeds"),
+            pytest.param(b"", b"error", 1, False, id="failure_nonfatal"),
+            # When --auto fails, auto_merge_pr must NOT fall back to a direct merge
+            pytest.param(b"", b"not enabled", 1, False, id="no_direct_fallback"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_auto_merge_called_after_pr(self):
-        from claude_swarm.integrator import auto_merge_pr
-
+    async def test_auto_merge(self, stdout, stderr, returncode, expected):
         with patch("asyncio.create_subprocess_exec") as mock_exec:
-            proc_mock = AsyncMock()
-            proc_mock.communicate = AsyncMock(return_value=(b"", b""))
-            proc_mock.returncode = 0
-            mock_exec.return_value = proc_mock
+            mock_exec.return_value = _make_proc_mock(stdout, stderr, returncode)
 
             result = await auto_merge_pr("https://github.com/o/r/pull/1", Path("/tmp"))
-            assert result is True
-            # Should have been called with --auto --squash
+            assert result is expected
+            # Exactly one attempt, always with --auto --squash
+            assert mock_exec.call_count == 1
             args = mock_exec.call_args[0]
             assert "gh" in args
             assert "--auto" in args
             assert "--squash" in args
 
-    @pytest.mark.asyncio
-    async def test_auto_merge_failure_nonfatal(self):
-        from claude_swarm.integrator import auto_merge_pr
-
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            proc_mock = AsyncMock()
-            proc_mock.communicate = AsyncMock(return_value=(b"", b"error"))
-            proc_mock.returncode = 1
-            mock_exec.return_value = proc_mock
-
-            result = await auto_merge_pr("https://github.com/o/r/pull/1", Path("/tmp"))
-            assert result is False
-            # Only one attempt — no fallback to direct merge
-            assert mock_exec.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_auto_merge_gh_auto_succeeds(self):
-        from claude_swarm.integrator import auto_merge_pr
-
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            proc_mock = AsyncMock()
-            proc_mock.communicate = AsyncMock(return_value=(b"ok", b""))
-            proc_mock.returncode = 0
-            mock_exec.return_value = proc_mock
-
-            result = await auto_merge_pr("https://github.com/o/r/pull/1", Path("/tmp"))
-            assert result is True
-            assert mock_exec.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_auto_merge_no_direct_fallback(self):
-        """When --auto fails, auto_merge_pr should NOT fall back to a direct merge."""
-        from claude_swarm.integrator import auto_merge_pr
-
-        with patch("asyncio.create_subprocess_exec") as mock_exec:
-            proc_mock = AsyncMock()
-            proc_mock.communicate = AsyncMock(return_value=(b"", b"not enabled"))
-            proc_mock.returncode = 1
-            mock_exec.return_value = proc_mock
-
-            result = await auto_merge_pr("https://github.com/o/r/pull/1", Path("/tmp"))
-            assert result is False
-            # Must NOT attempt a second (direct) merge
-            assert mock_exec.call_count == 1
-
 
 # ---------------------------------------------------------------------------
 # TestOversightState
@@ -236,16 +213,12 @@ class TestAutonomousMode:
 
 class TestOversightState:
     def test_oversight_in_config_snapshot(self, tmp_path):
-        from claude_swarm.state import StateManager
-
         config = SwarmConfig(task="test", repo_path=tmp_path, oversight="checkpoint")
         mgr = StateManager(tmp_path)
         run_state = mgr.start_run("run-1", "test", config)
         assert run_state.config_snapshot["oversight"] == "checkpoint"
 
     def test_paused_checkpoint_status_transition(self, tmp_path):
-        from claude_swarm.state import StateManager
-
         config = SwarmConfig(task="test", repo_path=tmp_path)
         mgr = StateManager(tmp_path)
         mgr.start_run("run-1", "test", config)
@@ -254,8 +227,6 @@ class TestOversightState:
         assert run.status == RunStatus.PAUSED_CHECKPOINT
 
     def test_default_oversight_is_pr_gated(self, tmp_path):
-        from claude_swarm.state import StateManager
-
         config = SwarmConfig(task="test", repo_path=tmp_path)
         mgr = StateManager(tmp_path)
         run_state = mgr.start_run("run-1", "test", config)
@@ -1,5 +1,9 @@
 """Tests for system prompts."""
 
+import re
+
+import pytest
+
 from claude_swarm.prompts import (
     CONFLICT_RESOLVER_SYSTEM_PROMPT,
     PLANNER_SYSTEM_PROMPT,
@@ -10,56 +14,91 @@ from claude_swarm.prompts import (
     WORKER_NOTES_SECTION,
     WORKER_RETRY_CONTEXT,
     WORKER_SYSTEM_PROMPT,
+    render_planner_prompt,
 )
 
-
-def test_planner_prompt_format():
-    result = PLANNER_SYSTEM_PROMPT.format(max_workers=4)
-    assert "4" in result
-    assert "{max_workers}" not in result
-    # Literal braces should survive .format()
-    assert '"original_task"' in result
-
-
-def test_planner_prompt_preserves_json_braces():
-    result = PLANNER_SYSTEM_PROMPT.format(max_workers=8)
-    assert "{" in result  # JSON example braces should be preserved
-
-
-def test_worker_prompt_format():
-    result = WORKER_SYSTEM_PROMPT.format(
-        task_description="Do something",
-        target_files="- file.py",
-        acceptance_criteria="- It works",
-    )
-    assert "Do something" in result
-    assert "- file.py" in result
-    assert "- It works" in result
-
-
-def test_worker_prompt_no_extra_placeholders():
-    result = WORKER_SYSTEM_PROMPT.format(
-        task_description="x",
-        target_files="y",
-        acceptance_criteria="z",
-    )
-    # No remaining {placeholders}
-    import re
-    remaining = re.findall(r"\{[a-z_]+\}", result)
-    assert remaining == []
-
-
-def test_reviewer_prompt_no_format_placeholders():
-    # REVIEWER_SYSTEM_PROMPT should have no .format() placeholders
-    import re
-    placeholders = re.findall(r"\{[a-z_]+\}", REVIEWER_SYSTEM_PROMPT)
-    assert placeholders == []
-
-
-def test_worker_retry_context_format():
-    result = WORKER_RETRY_CONTEXT.format(error_context="some error happened")
-    assert "some error happened" in result
-    assert "Previous Attempt Failed" in result
+_PLACEHOLDER_RE = re.compile(r"\{[a-z_]+\}")
+
+_PLANNER_KWARGS = {"max_workers": 4}
+_WORKER_KWARGS = {
+    "task_description": "Do something",
+    "target_files": "- file.py",
+    "acceptance_criteria": "- It works",
+}
+_NOTES_KWARGS = {"notes_dir_path": "/tmp/notes", "worker_id": "w1"}
+_COORDINATION_KWARGS = {"coordination_dir_path": "/tmp/coordination", "worker_id": "w1"}
+_COUPLING_KWARGS = {"coupled_workers": "w2, w3", "shared_interfaces": "User API schema, event payload"}
+
+
+@pytest.mark.parametrize(
+    ("prompt", "kwargs", "must_contain"),
+    [
+        pytest.param(
+            PLANNER_SYSTEM_PROMPT, _PLANNER_KWARGS,
+            ["4", '"original_task"', "coordination_notes", "Coordination", "coupled_with",
+             "shared_interfaces", "Shared Notes", "Directed Messages"],
+            id="planner",
+        ),
+        pytest.param(WORKER_SYSTEM_PROMPT, _WORKER_KWARGS, ["Do something", "- file.py", "- It works"], id="worker"),
+        pytest.param(
+            WORKER_RETRY_CONTEXT, {"error_context": "some error happened"},
+            ["some error happened", "Previous Attempt Failed"],
+            id="retry_context",
+        ),
+        pytest.param(WORKER_NOTES_SECTION, _NOTES_KWARGS, ["/tmp/notes", "w1", "Write"], id="notes_section"),
+        pytest.param(
+            WORKER_COORDINATION_INSTRUCTIONS, {"coordination_instructions": "Write a note about the API schema"},
+            ["Write a note about the API schema", "Coordination Instructions"],
+            id="coordination_instructions",
+        ),
+        pytest.param(
+            WORKER_COORDINATION_SECTION, _COORDINATION_KWARGS,
+            ["/tmp/coordination", "w1", "Shared Notes", "Directed Messages", "Status Updates", "message_type"],
+            id="coordination_section",
+        ),
+        pytest.param(
+            WORKER_COUPLING_SECTION, _COUPLING_KWARGS,
+            ["w2, w3", "User API schema", "Coupled Workers"],
+            id="coupling_section",
+        ),
+    ],
+)
+def test_prompt_format(prompt, kwargs, must_contain):
+    result = prompt.format(**kwargs)
+    for expected in must_contain:
+        assert expected in result
+    for name in kwargs:
+        assert "{" + name + "}" not in result
+
+
+@pytest.mark.parametrize(
+    ("prompt", "kwargs"),
+    [
+        pytest.param(WORKER_SYSTEM_PROMPT, _WORKER_KWARGS, id="worker"),
+        # REVIEWER_SYSTEM_PROMPT is used verbatim, never .format()ed
+        pytest.param(REVIEWER_SYSTEM_PROMPT, None, id="reviewer"),
+        pytest.param(WORKER_COUPLING_SECTION, _COUPLING_KWARGS, id="coupling_section"),
+    ],
+)
+def test_no_extra_placeholders(prompt, kwargs):
+    result = prompt if kwargs is None else prompt.format(**kwargs)
+    assert _PLACEHOLDER_RE.findall(result) == []
+
+
+@pytest.mark.parametrize(
+    ("prompt", "kwargs", "json_marker"),
+    [
+        pytest.param(PLANNER_SYSTEM_PROMPT, _PLANNER_KWARGS, '"original_task"', id="planner"),
+        pytest.param(WORKER_NOTES_SECTION, _NOTES_KWARGS, '"worker_id"', id="notes_section"),
+        pytest.param(WORKER_COORDINATION_SECTION, _COORDINATION_KWARGS, '"worker_id"', id="coordination_section"),
+    ],
+)
+def test_json_braces_survive_format(prompt, kwargs, json_marker):
+    result = prompt.format(**kwargs)
+    # Escaped {{ }} in JSON examples must come out as single braces
+    assert json_marker in result
+    assert "{\n" in result
+    assert "{{" not in result
 
 
 def test_conflict_resolver_prompt_non_empty():
@@ -68,86 +107,7 @@ def test_conflict_resolver_prompt_non_empty():
     assert "merge conflict" in CONFLICT_RESOLVER_SYSTEM_PROMPT.lower()
 
 
-def test_worker_notes_section_format():
-    result = WORKER_NOTES_SECTION.format(
-        notes_dir_path="/tmp/notes",
-        worker_id="w1",
-    )
-    assert "/tmp/notes" in result
-    assert "w1" in result
-    assert "Write tool" in result or "Write" in result
-
-
-def test_notes_section_preserves_json_braces():
-    result = WORKER_NOTES_SECTION.format(
-        notes_dir_path="/tmp/notes",
-        worker_id="w1",
-    )
-    # JSON example braces should survive .format() as single braces
-    assert '"worker_id"' in result
-    assert "{\n" in result  # Opening brace of JSON example
-    assert "{{" not in result  # No double-braces in output
-
-
-def test_planner_includes_coordination_guidance():
-    result = PLANNER_SYSTEM_PROMPT.format(max_workers=4)
-    assert "coordination_notes" in result
-    assert "Coordination" in result
-    assert "coupled_with" in result
-    assert "shared_interfaces" in result
-
-
-def test_planner_includes_shared_notes_in_coordination():
-    result = PLANNER_SYSTEM_PROMPT.format(max_workers=4)
-    assert "Shared Notes" in result
-    assert "Directed Messages" in result
-
-
-def test_worker_coordination_instructions_format():
-    result = WORKER_COORDINATION_INSTRUCTIONS.format(
-        coordination_instructions="Write a note about the API schema",
-    )
-    assert "Write a note about the API schema" in result
-    assert "Coordination Instructions" in result
-
-
-def test_worker_coordination_section_format():
-    result = WORKER_COORDINATION_SECTION.format(
-        coordination_dir_path="/tmp/coordination",
-        worker_id="w1",
-    )
-    assert "/tmp/coordination" in result
-    assert "w1" in result
-    assert "Shared Notes" in result
-    assert "Directed Messages" in result
-    assert "Status Updates" in result
-    assert "message_type" in result
-
-
-def test_coordination_section_preserves_json_braces():
-    result = WORKER_COORDINATION_SECTION.format(
-        coordination_dir_path="/tmp/coordination",
-        worker_id="w1",
-    )
-    assert '"worker_id"' in result
-    assert "{{" not in result
-
-
-def test_worker_coupling_section_format():
-    result = WORKER_COUPLING_SECTION.format(
-        coupled_workers="w2, w3",
-        shared_interfaces="User API schema, event payload",
-    )
-    assert "w2, w3" in result
-    assert "User API schema" in result
-    assert "Coupled Workers" in result
-
-
-def test_coupling_section_no_extra_placeholders():
-    import re
-    result = WORKER_COUPLING_SECTION.format(
-        coupled_workers="w2",
-        shared_interfaces="API schema",
-    )
-    remaining = re.findall(r"\{[a-z_]+\}", result)
-    assert remaining == []
+def test_render_planner_prompt_matches_format():
+    rendered = render_planner_prompt(4)
+    assert rendered == PLANNER_SYSTEM_PROMPT.format(**_PLANNER_KWARGS)
+    assert render_planner_prompt(4) is rendered
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -11,8 +11,8 @@ from claude_swarm.models import WorkerResult, WorkerTask
 from claude_swarm.worker import spawn_worker_with_retry
 
 
-def _make_task() -> WorkerTask:
-    return WorkerTask(worker_id="w1", title="Test task", description="Do the thing")
+# spawn_worker_with_retry only reads the task, so one instance serves every test
+_TASK = WorkerTask(worker_id="w1", title="Test task", description="Do the thing")
 
 
 def _ok_result(**kwargs) -> WorkerResult:
@@ -23,50 +23,55 @@ def _fail_result(**kwargs) -> WorkerResult:
     return WorkerResult(worker_id="w1", success=False, error="something broke", **kwargs)
 
 
+@pytest.fixture()
+def spawn_attempts(monkeypatch):
+    """Patch _spawn_single_attempt to return *results* in order; returns the mock.
+
+    Results are fresh per call: the retry loop sets attempt/model_used on them.
+    """
+    def _install(*results: WorkerResult) -> AsyncMock:
+        mock_spawn = AsyncMock(side_effect=list(results))
+        monkeypatch.setattr("claude_swarm.worker._spawn_single_attempt", mock_spawn)
+        return mock_spawn
+    return _install
+
+
 class TestRetryBasics:
     @pytest.mark.asyncio
-    async def test_single_attempt_success(self, tmp_path):
+    async def test_single_attempt_success(self, tmp_path, spawn_attempts):
         """Success on first attempt — no retry needed."""
-        mock_spawn = AsyncMock(return_value=_ok_result())
-
-        with patch("claude_swarm.worker._spawn_single_attempt", mock_spawn):
-            result = await spawn_worker_with_retry(_make_task(), tmp_path, max_retries=2)
+        mock_spawn = spawn_attempts(_ok_result())
+        result = await spawn_worker_with_retry(_TASK, tmp_path, max_retries=2)
 
         assert result.success is True
         assert result.attempt == 1
         mock_spawn.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_first_fails_second_succeeds(self, tmp_path):
+    async def test_first_fails_second_succeeds(self, tmp_path, spawn_attempts):
         """First attempt fails, second succeeds."""
-        mock_spawn = AsyncMock(side_effect=[_fail_result(), _ok_result()])
-
-        with patch("claude_swarm.worker._spawn_single_attempt", mock_spawn):
-            result = await spawn_worker_with_retry(_make_task(), tmp_path, max_retries=2)
+        mock_spawn = spawn_attempts(_fail_result(), _ok_result())
+        result = await spawn_worker_with_retry(_TASK, tmp_path, max_retries=2)
 
         assert result.success is True
         assert result.attempt == 2
         assert mock_spawn.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_all_attempts_fail(self, tmp_path):
+    async def test_all_attempts_fail(self, tmp_path, spawn_attempts):
         """All attempts fail — returns last failed result."""
-        mock_spawn = AsyncMock(side_effect=[_fail_result(), _fail_result(), _fail_result()])
-
-        with patch("claude_swarm.worker._spawn_single_attempt", mock_spawn):
-            result = await spawn_worker_with_retry(_make_task(), tmp_path, max_retries=3)
+        mock_spawn = spawn_attempts(_fail_result(), _fail_result(), _fail_result())
+        result = await spawn_worker_with_retry(_TASK, tmp_path, max_retries=3)
 
         assert result.success is False
         assert result.attempt == 3
         assert mock_spawn.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_max_retries_one_no_retry(self, tmp_path):
+    async def test_max_retries_one_no_retry(self, tmp_path, spawn_attempts):
         """max_retries=1 means only one attempt, no retry."""
-        mock_spawn = AsyncMock(return_value=_fail_result())
-
-        with patch("claude_swarm.worker._spawn_single_attempt", mock_spawn):
-            result = await spawn_worker_with_retry(_make_task(), tmp_path, max_retries=1)
+        mock_spawn = spawn_attempts(_fail_result())
+        result = await spawn_worker_with_retry(_TASK, tmp_path, max_retries=1)
 
         assert result.success is False
         assert result.attempt == 1
@@ -75,16 +80,14 @@ class TestRetryBasics:
 
 class TestModelEscalation:
     @pytest.mark.asyncio
-    async def test_escalation_on_retry(self, tmp_path):
+    async def test_escalation_on_retry(self, tmp_path, spawn_attempts):
         """First attempt uses base model, retry escalates."""
-        mock_spawn = AsyncMock(side_effect=[_fail_result(), _ok_result()])
-
-        with patch("claude_swarm.worker._spawn_single_attempt", mock_spawn):
-            result = await spawn_worker_with_retry(
-                _make_task(), tmp_path,
-                model="sonnet", max_retries=2,
-                escalation_model="opus", enable_escalation=True,
-            )
+        mock_spawn = spawn_attempts(_fail_result(), _ok_result())
+        result = await spawn_worker_with_retry(
+            _TASK, tmp_path,
+            model="sonnet", max_retries=2,
+            escalation_model="opus", enable_escalation=True,
+        )
 
         assert result.success is True
         assert result.model_used == "opus"
@@ -96,16 +99,29 @@ class TestModelEscalation:
         assert second_call_kwargs["model"] == "opus"
 
     @pytest.mark.asyncio
-    async def test_no_escalation_flag(self, tmp_path):
-        """enable_escalation=False keeps same model on retry."""
-        mock_spawn = AsyncMock(side_effect=[_fail_result(), _ok_result()])
+    async def test_escalation_only_on_final_attempt(self, tmp_path, spawn_attempts):
+        """With three attempts the cheap model gets a retry with context before escalating."""
+        mock_spawn = spawn_attempts(_fail_result(), _fail_result(), _ok_result())
+        result = await spawn_worker_with_retry(
+            _TASK, tmp_path,
+            model="sonnet", max_retries=3,
+            escalation_model="opus", enable_escalation=True,
+        )
+
+        assert result.success is True
+        assert result.model_used == "opus"
+        models = [c.kwargs["model"] for c in mock_spawn.call_args_list]
+        assert models == ["sonnet", "sonnet", "opus"]
 
-        with patch("claude_swarm.worker._spawn_single_attempt", mock_spawn):
-            result = await spawn_worker_with_retry(
-                _make_task(), tmp_path,
-                model="sonnet", max_retries=2,
-                enable_escalation=False,
-            )
+    @pytest.mark.asyncio
+    async def test_no_escalation_flag(self, tmp_path, spawn_attempts):
+        """enable_escalation=False keeps same model on retry."""
+        mock_spawn = spawn_attempts(_fail_result(), _ok_result())
+        result = await spawn_worker_with_retry(
+            _TASK, tmp_path,
+            model="sonnet", max_retries=2,
+            enable_escalation=False,
+        )
 
         assert result.success is True
         assert result.model_used == "sonnet"
@@ -115,12 +131,10 @@ class TestModelEscalation:
 
 class TestRetryContext:
     @pytest.mark.asyncio
-    async def test_error_context_included_in_retry(self, tmp_path):
+    async def test_error_context_included_in_retry(self, tmp_path, spawn_attempts):
         """Error from first attempt is passed as extra_context on retry."""
-        mock_spawn = AsyncMock(side_effect=[_fail_result(), _ok_result()])
-
-        with patch("claude_swarm.worker._spawn_single_attempt", mock_spawn):
-            await spawn_worker_with_retry(_make_task(), tmp_path, max_retries=2)
+        mock_spawn = spawn_attempts(_fail_result(), _ok_result())
+        await spawn_worker_with_retry(_TASK, tmp_path, max_retries=2)
 
         # First call should have no extra context
         first_call_kwargs = mock_spawn.call_args_list[0].kwargs
@@ -131,15 +145,13 @@ class TestRetryContext:
         assert "Previous Attempt Failed" in second_call_kwargs["extra_context"]
 
     @pytest.mark.asyncio
-    async def test_result_fields_set_correctly(self, tmp_path):
+    async def test_result_fields_set_correctly(self, tmp_path, spawn_attempts):
         """Result has correct attempt and model_used fields."""
-        mock_spawn = AsyncMock(return_value=_ok_result())
-
-        with patch("claude_swarm.worker._spawn_single_attempt", mock_spawn):
-            result = await spawn_worker_with_retry(
-                _make_task(), tmp_path,
-                model="sonnet", max_retries=1,
-            )
+        mock_spawn = spawn_attempts(_ok_result())
+        result = await spawn_worker_with_retry(
+            _TASK, tmp_path,
+            model="sonnet", max_retries=1,
+        )
 
         assert result.attempt == 1
         assert result.model_used == "sonnet"
@@ -115,3 +115,18 @@ class TestSessionRecorder:
         assert events[0]["success"] is True
         assert events[0]["branches"] == ["branch-a", "branch-b"]
         assert events[0]["error"] is None
+
+    def test_events_visible_before_close(self, tmp_path):
+        s = SessionRecorder(tmp_path, "run-1")
+        s.record("first")
+        # Live readers (the dashboard) must see each event as soon as it's recorded
+        assert len(_read_events(s)) == 1
+        s.close()
+
+    def test_record_after_close_reopens(self, tmp_path):
+        s = SessionRecorder(tmp_path, "run-1")
+        s.record("first")
+        s.write_metadata()
+        s.record("second")
+        s.close()
+        assert [e["event"] for e in _read_events(s)] == ["first", "second"]
@@ -275,3 +275,48 @@ class TestCompleteCostAccumulation:
         state_mgr.complete_run("run-1")
         run = state_mgr.get_run("run-1")
         assert abs(run.total_cost_usd - 0.30) < 0.001
+
+
+class TestTransaction:
+    def test_single_save_on_exit(self, state_mgr, sample_config, monkeypatch):
+        state_mgr.start_run("run-1", "test", sample_config)
+        writes = []
+        real_write = state_mgr._write
+
+        def counting_write(state):
+            writes.append(state)
+            real_write(state)
+
+        monkeypatch.setattr(state_mgr, "_write", counting_write)
+        with state_mgr.transaction():
+            state_mgr.register_worker("run-1", "w1", "W1", "b1")
+            state_mgr.register_worker("run-1", "w2", "W2", "b2")
+            state_mgr.update_worker("run-1", "w1", cost_usd=0.10)
+            # Nothing reaches disk until the block exits
+            assert StateManager(state_mgr.repo_path).get_run("run-1").workers == {}
+        assert len(writes) == 1
+        run = StateManager(state_mgr.repo_path).get_run("run-1")
+        assert set(run.workers) == {"w1", "w2"}
+        assert run.workers["w1"].cost_usd == 0.10
+
+    def test_nested_joins_outer(self, state_mgr, sample_config):
+        state_mgr.start_run("run-1", "test", sample_config)
+        with state_mgr.transaction():
+            with state_mgr.transaction():
+                state_mgr.register_worker("run-1", "w1", "W1", "b1")
+            assert "w1" not in StateManager(state_mgr.repo_path).get_run("run-1").workers
+        assert "w1" in state_mgr.get_run("run-1").workers
+
+    def test_exception_discards_changes(self, state_mgr, sample_config):
+        state_mgr.start_run("run-1", "test", sample_config)
+        with pytest.raises(RuntimeError):
+            with state_mgr.transaction():
+                state_mgr.register_worker("run-1", "w1", "W1", "b1")
+                raise RuntimeError("boom")
+        assert state_mgr.get_run("run-1").workers == {}
+
+    def test_clear_all_inside_transaction(self, state_mgr, sample_config):
+        state_mgr.start_run("run-1", "test", sample_config)
+        with state_mgr.transaction():
+            state_mgr.clear_all()
+        assert state_mgr.get_run("run-1") is None
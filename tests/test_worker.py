@@ -28,9 +28,9 @@ def _make_task(**kwargs) -> WorkerTask:
 
 class TestSpawnWorker:
     @pytest.mark.asyncio
-    async def test_success_path(self, make_result_message, tmp_path):
+    async def test_success_path(self, make_result_message, async_return, tmp_path):
         msg = make_result_message(result="All done", total_cost_usd=0.05)
-        with patch("claude_swarm.worker.run_agent", new_callable=AsyncMock, return_value=msg):
+        with patch("claude_swarm.worker.run_agent", async_return(msg)):
             result = await spawn_worker(_make_task(), tmp_path)
             assert result.success is True
             assert result.cost_usd == 0.05
@@ -38,9 +38,9 @@ class TestSpawnWorker:
             assert result.summary == "All done"
 
     @pytest.mark.asyncio
-    async def test_error_result(self, make_result_message, tmp_path):
+    async def test_error_result(self, make_result_message, async_return, tmp_path):
         msg = make_result_message(result="Something broke", is_error=True, total_cost_usd=0.02)
-        with patch("claude_swarm.worker.run_agent", new_callable=AsyncMock, return_value=msg):
+        with patch("claude_swarm.worker.run_agent", async_return(msg)):
             result = await spawn_worker(_make_task(), tmp_path)
             assert result.success is False
             assert result.error == "Something broke"
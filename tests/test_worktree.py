@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import subprocess
+import contextlib
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -12,33 +11,23 @@ from claude_swarm.errors import WorktreeError
 from claude_swarm.worktree import WorktreeManager, _run_git
 
 
-class TestWorktreeBasics:
-    @pytest.mark.asyncio
-    async def test_create_worktree_exists(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
-        path = await mgr.create_worktree("w1", "main")
-        assert path.exists()
-        assert path.is_dir()
+@pytest.fixture()
+def mgr(tmp_git_repo) -> WorktreeManager:
+    """WorktreeManager for run "run-1" over a fresh repo copy."""
+    return WorktreeManager(tmp_git_repo, "run-1")
 
-    @pytest.mark.asyncio
-    async def test_create_worktree_correct_branch(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
-        path = await mgr.create_worktree("w1", "main")
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=path, capture_output=True, text=True,
-        )
-        assert result.stdout.strip() == "swarm/run-1/w1"
 
+class TestWorktreeBasics:
     @pytest.mark.asyncio
-    async def test_worktree_has_repo_content(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_create_worktree(self, mgr):
         path = await mgr.create_worktree("w1", "main")
+        assert path.is_dir()
         assert (path / "README.md").exists()
+        head = await _run_git(["rev-parse", "--abbrev-ref", "HEAD"], path)
+        assert head == "swarm/run-1/w1"
 
     @pytest.mark.asyncio
-    async def test_create_multiple_worktrees(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_create_multiple_worktrees(self, mgr):
         paths = []
         for i in range(3):
             p = await mgr.create_worktree(f"w{i}", "main")
@@ -50,55 +39,44 @@ class TestWorktreeBasics:
 
 class TestWorktreeRemoval:
     @pytest.mark.asyncio
-    async def test_remove_worktree(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_remove_worktree(self, mgr):
         path = await mgr.create_worktree("w1", "main")
         assert path.exists()
         await mgr.remove_worktree("w1")
         assert not path.exists()
 
     @pytest.mark.asyncio
-    async def test_cleanup_all_no_force_preserves_branches(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_cleanup_all_no_force_preserves_branches(self, mgr, tmp_git_repo):
         await mgr.create_worktree("w1", "main")
         branch = mgr.get_branch_name("w1")
         await mgr.cleanup_all(force=False)
         # Branch should still exist
-        result = subprocess.run(
-            ["git", "branch", "--list", branch],
-            cwd=tmp_git_repo, capture_output=True, text=True,
-        )
-        assert "swarm/run-1/w1" in result.stdout
+        listed = await _run_git(["branch", "--list", branch], tmp_git_repo)
+        assert "swarm/run-1/w1" in listed
 
     @pytest.mark.asyncio
-    async def test_cleanup_all_force_removes_branches(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_cleanup_all_force_removes_branches(self, mgr, tmp_git_repo):
         await mgr.create_worktree("w1", "main")
         await mgr.cleanup_all(force=True)
-        result = subprocess.run(
-            ["git", "branch", "--list", "swarm/*"],
-            cwd=tmp_git_repo, capture_output=True, text=True,
-        )
-        assert result.stdout.strip() == ""
+        listed = await _run_git(["branch", "--list", "swarm/*"], tmp_git_repo)
+        assert listed == ""
         # .swarm-worktrees should be gone
         assert not (tmp_git_repo / ".swarm-worktrees").exists()
 
 
 class TestWorktreeInfo:
     @pytest.mark.asyncio
-    async def test_get_base_branch(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_get_base_branch(self, mgr):
         branch = await mgr.get_base_branch()
         assert branch == "main"
 
-    @pytest.mark.asyncio
-    async def test_get_branch_name(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    def test_get_branch_name(self):
+        # Pure string computation: no repo needed
+        mgr = WorktreeManager(Path("/nonexistent"), "run-1")
         assert mgr.get_branch_name("w1") == "swarm/run-1/w1"
 
     @pytest.mark.asyncio
-    async def test_worker_branches_excludes_integration(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_worker_branches_excludes_integration(self, mgr):
         await mgr.create_worktree("w1", "main")
         await mgr.create_integration_worktree("main")
         branches = mgr.worker_branches
@@ -108,27 +86,22 @@ class TestWorktreeInfo:
 
 class TestWorktreeDiffs:
     @pytest.mark.asyncio
-    async def test_get_worktree_changed_files(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_get_worktree_changed_files(self, mgr):
         path = await mgr.create_worktree("w1", "main")
         # Create, add, commit a new file in the worktree
         new_file = path / "new.txt"
         new_file.write_text("hello\n")
-        subprocess.run(["git", "add", "new.txt"], cwd=path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "add new"],
-            cwd=path, check=True, capture_output=True,
-        )
+        await _run_git(["add", "new.txt"], path)
+        await _run_git(["commit", "-m", "add new"], path)
         files = await mgr.get_worktree_changed_files("w1")
         assert "new.txt" in files
 
     @pytest.mark.asyncio
-    async def test_get_worktree_diff(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_get_worktree_diff(self, mgr):
         path = await mgr.create_worktree("w1", "main")
         # Stage a change without committing
         (path / "README.md").write_text("# Modified\n")
-        subprocess.run(["git", "add", "README.md"], cwd=path, check=True, capture_output=True)
+        await _run_git(["add", "README.md"], path)
         diff = await mgr.get_worktree_diff("w1")
         # git diff HEAD shows staged changes
         assert "Modified" in diff
@@ -136,69 +109,77 @@ class TestWorktreeDiffs:
 
 class TestWorktreeGC:
     @pytest.mark.asyncio
-    async def test_disable_gc(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_disable_gc(self, mgr, tmp_git_repo):
         await mgr.disable_gc()
-        result = subprocess.run(
-            ["git", "config", "gc.auto"], cwd=tmp_git_repo,
-            capture_output=True, text=True,
-        )
-        assert result.stdout.strip() == "0"
+        assert await _run_git(["config", "gc.auto"], tmp_git_repo) == "0"
 
     @pytest.mark.asyncio
-    async def test_restore_gc(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_restore_gc(self, mgr, tmp_git_repo):
         await mgr.disable_gc()
         await mgr.restore_gc()
-        result = subprocess.run(
-            ["git", "config", "gc.auto"], cwd=tmp_git_repo,
-            capture_output=True, text=True,
-        )
-        # Should be unset (non-zero exit)
-        assert result.returncode != 0 or result.stdout.strip() != "0"
+        # Should be unset: git config exits non-zero and prints nothing
+        assert await _run_git(["config", "gc.auto"], tmp_git_repo, check=False) != "0"
+
+
+_LOCKED = (128, b"", b"Unable to create lock file")
+_OK = (0, b"success", b"")
+
+
+class _FakeProc:
+    """Minimal stand-in for asyncio.subprocess.Process."""
+
+    __slots__ = ("returncode", "_output")
+
+    def __init__(self, returncode: int, stdout: bytes, stderr: bytes) -> None:
+        self.returncode = returncode
+        self._output = (stdout, stderr)
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        return self._output
+
+
+@pytest.fixture()
+def fake_exec(monkeypatch):
+    """Replace create_subprocess_exec with fakes yielding (returncode, stdout, stderr).
+
+    Call the returned installer with the outcomes in order; it returns the
+    list of argv tuples the fake was called with.
+    """
+    def _install(outcomes: list[tuple[int, bytes, bytes]]) -> list[tuple]:
+        pending = list(outcomes)
+        calls: list[tuple] = []
+
+        async def fake(*args, **kwargs):
+            calls.append(args)
+            return _FakeProc(*pending.pop(0))
+
+        monkeypatch.setattr("asyncio.create_subprocess_exec", fake)
+        return calls
+    return _install
 
 
 class TestRunGitRetry:
-    @pytest.mark.asyncio
-    async def test_lock_retry(self, tmp_git_repo):
-        """Mock a process that fails with 'lock' then succeeds."""
-        call_count = 0
-
-        async def fake_exec(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            mock_proc = AsyncMock()
-            if call_count == 1:
-                mock_proc.communicate.return_value = (b"", b"Unable to create lock file")
-                mock_proc.returncode = 128
-            else:
-                mock_proc.communicate.return_value = (b"success", b"")
-                mock_proc.returncode = 0
-            return mock_proc
-
-        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
-            result = await _run_git(["status"], tmp_git_repo, retries=3)
-            assert result == "success"
-            assert call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_lock_exhaustion_raises(self, tmp_git_repo):
-        """All retries fail with lock contention -> WorktreeError."""
-        call_count = 0
-
-        async def always_locked(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            mock_proc = AsyncMock()
-            mock_proc.communicate.return_value = (b"", b"Unable to create lock file")
-            mock_proc.returncode = 128
-            return mock_proc
-
-        with patch("asyncio.create_subprocess_exec", side_effect=always_locked):
-            with pytest.raises(WorktreeError, match="failed after 3 retries"):
-                await _run_git(["status"], tmp_git_repo, retries=3)
-        # Should have retried before failing (3 attempts total)
-        assert call_count == 3
+    # Exercises the real GIT_LOCK_BACKOFF sleeps
+    pytestmark = pytest.mark.slow
+
+    @pytest.mark.parametrize(
+        ("outcomes", "expectation", "expected_calls"),
+        [
+            # Lock contention once, then success
+            pytest.param([_LOCKED, _OK], contextlib.nullcontext(), 2, id="lock_then_ok"),
+            # All 3 attempts hit the lock -> WorktreeError
+            pytest.param(
+                [_LOCKED] * 3, pytest.raises(WorktreeError, match="failed after 3 retries"), 3,
+                id="lock_exhaustion_raises",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_lock_retry(self, tmp_git_repo, fake_exec, outcomes, expectation, expected_calls):
+        calls = fake_exec(outcomes)
+        with expectation:
+            assert await _run_git(["status"], tmp_git_repo, retries=3) == "success"
+        assert len(calls) == expected_calls
 
     @pytest.mark.asyncio
     async def test_check_false_returns_on_failure(self, tmp_git_repo):
@@ -212,23 +193,16 @@ class TestRunGitRetry:
 
 class TestBranchHasCommits:
     @pytest.mark.asyncio
-    async def test_branch_with_commits(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_branch_with_commits(self, mgr):
         path = await mgr.create_worktree("w1", "main")
-        # Commit a file in the worktree
-        new_file = path / "added.txt"
-        new_file.write_text("content\n")
-        subprocess.run(["git", "add", "added.txt"], cwd=path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "-c", "user.email=t@t.com", "-c", "user.name=T", "commit", "-m", "add file"],
-            cwd=path, check=True, capture_output=True,
-        )
+        # Commit an edit to a tracked file — commit -a stages it, no separate git add
+        (path / "README.md").write_text("# Edited\n")
+        await _run_git(["commit", "-a", "-m", "edit readme"], path)
         has = await mgr.branch_has_commits("swarm/run-1/w1", "main")
         assert has is True
 
     @pytest.mark.asyncio
-    async def test_branch_without_commits(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_branch_without_commits(self, mgr):
         await mgr.create_worktree("w1", "main")
         # No commits made — branch is at same point as main
         has = await mgr.branch_has_commits("swarm/run-1/w1", "main")
@@ -237,13 +211,11 @@ class TestBranchHasCommits:
 
 class TestWorktreeErrorPaths:
     @pytest.mark.asyncio
-    async def test_get_worktree_diff_unknown_worker(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_get_worktree_diff_unknown_worker(self, mgr):
         with pytest.raises(WorktreeError, match="No worktree found"):
             await mgr.get_worktree_diff("nonexistent")
 
     @pytest.mark.asyncio
-    async def test_get_worktree_changed_files_unknown_worker(self, tmp_git_repo):
-        mgr = WorktreeManager(tmp_git_repo, "run-1")
+    async def test_get_worktree_changed_files_unknown_worker(self, mgr):
         with pytest.raises(WorktreeError, match="No worktree found"):
             await mgr.get_worktree_changed_files("nonexistent")